@@ -12,12 +12,16 @@ The module auto-detects which mode to use.
 
 from __future__ import annotations
 
+import codecs
 import csv
 import io
 import logging
+import os
 import re
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Tuple
+from typing import Iterator, List, Tuple
 
 log = logging.getLogger(__name__)
 
@@ -26,35 +30,128 @@ log = logging.getLogger(__name__)
 # Raw text readers
 # ──────────────────────────────────────────────────────────────────────
 
-def extract_text_from_pdf(filepath: str | Path) -> str:
-    """Extract all text from a PDF using PyMuPDF (fitz)."""
+def iter_pdf_pages(filepath: str | Path) -> Iterator[str]:
+    """Yield the text of each PDF page, one page at a time.
+
+    Streaming avoids holding both the page list and the joined document
+    string in memory at once — downstream NLP can consume pages as
+    natural chunks.
+    """
     import fitz  # PyMuPDF
 
     filepath = Path(filepath)
     if not filepath.exists():
         raise FileNotFoundError(f"PDF not found: {filepath}")
 
-    text_parts: list[str] = []
     with fitz.open(str(filepath)) as doc:
         for page in doc:
-            page_text = page.get_text("text")
+            # Build the TextPage ourselves with text-only flags so MuPDF
+            # skips image/drawing extraction, and drop it right away so
+            # per-page structures don't accumulate across a large document.
+            textpage = page.get_textpage(flags=fitz.TEXTFLAGS_TEXT)
+            page_text = textpage.extractText()
+            del textpage
             if page_text:
-                text_parts.append(page_text)
+                yield page_text
+
+
+# Below this page count the thread-pool overhead outweighs the gain.
+_PARALLEL_MIN_PAGES = 16
+
+
+def _extract_page_range(path: str, lo: int, hi: int) -> str:
+    """Worker: extract text from pages ``[lo, hi)``. Runs on a thread.
+
+    Each worker opens its own document handle — fitz documents are not
+    safe to share across threads, but extraction itself releases the
+    GIL, so threads parallelize it without process-spawn hazards (a
+    frozen windowed exe would re-launch the whole GUI per subprocess).
+    """
+    import fitz  # PyMuPDF
+
+    with fitz.open(path) as doc:
+        return "\n".join(
+            text
+            for text in (doc[i].get_text("text") for i in range(lo, hi))
+            if text
+        )
+
+
+def _extract_pdf_parallel(path: str, page_count: int, workers: int) -> str:
+    """Shard the page range across a thread pool and join in order."""
+    step = -(-page_count // workers)  # ceil division
+    ranges = [(lo, min(lo + step, page_count)) for lo in range(0, page_count, step)]
+    with ThreadPoolExecutor(max_workers=len(ranges)) as pool:
+        parts = list(
+            pool.map(
+                _extract_page_range,
+                (path for _ in ranges),
+                (lo for lo, _ in ranges),
+                (hi for _, hi in ranges),
+            )
+        )
+    return "\n".join(p for p in parts if p)
+
+
+def extract_text_from_pdf(filepath: str | Path) -> str:
+    """Extract all text from a PDF using PyMuPDF (fitz).
 
-    full_text = "\n".join(text_parts)
-    log.info("Extracted %d chars from %s (%d pages)", len(full_text), filepath.name, len(text_parts))
+    Large documents are sharded across a thread pool (MuPDF extraction
+    releases the GIL and is independent per page); small ones stay
+    serial to avoid the pool cost.
+    """
+    import fitz  # PyMuPDF
+
+    filepath = Path(filepath)
+    if not filepath.exists():
+        raise FileNotFoundError(f"PDF not found: {filepath}")
+
+    with fitz.open(str(filepath)) as doc:
+        page_count = doc.page_count
+
+    workers = min(os.cpu_count() or 1, 8)
+    if page_count >= _PARALLEL_MIN_PAGES and workers > 1:
+        full_text = _extract_pdf_parallel(str(filepath), page_count, workers)
+        log.info(
+            "Extracted %d chars from %s (%d pages, %d workers)",
+            len(full_text), filepath.name, page_count, workers,
+        )
+        return full_text
+
+    buf = io.StringIO()
+    pages = 0
+    for page_text in iter_pdf_pages(filepath):
+        if pages:
+            buf.write("\n")
+        buf.write(page_text)
+        pages += 1
+
+    full_text = buf.getvalue()
+    log.info("Extracted %d chars from %s (%d pages)", len(full_text), filepath.name, pages)
     return full_text
 
 
 def extract_text_from_txt(filepath: str | Path) -> str:
-    """Read a plain-text file with automatic encoding detection."""
+    """Read a plain-text file with automatic encoding detection.
+
+    The file is read from disk exactly once; decoding attempts run over
+    the in-memory bytes instead of re-reading per candidate encoding.
+    """
     filepath = Path(filepath)
     if not filepath.exists():
         raise FileNotFoundError(f"TXT file not found: {filepath}")
 
-    for encoding in ("utf-8", "utf-8-sig", "latin-1", "cp1252"):
+    raw = filepath.read_bytes()
+
+    # A UTF-8 BOM is unambiguous — decode directly and strip it.
+    if raw.startswith(codecs.BOM_UTF8):
+        encodings: tuple[str, ...] = ("utf-8-sig",)
+    else:
+        encodings = ("utf-8", "latin-1", "cp1252")
+
+    for encoding in encodings:
         try:
-            text = filepath.read_text(encoding=encoding)
+            text = raw.decode(encoding)
             log.info("Read %d chars from %s (encoding=%s)", len(text), filepath.name, encoding)
             return text
         except (UnicodeDecodeError, ValueError):
@@ -76,39 +173,96 @@ def extract_text(filepath: str | Path) -> str:
     raise ValueError(f"Unsupported file type: {ext}")
 
 
+def extract_text_stream(filepath: str | Path) -> Iterator[str]:
+    """Like :func:`extract_text` but yields chunks instead of one string.
+
+    PDFs are streamed page-by-page; plain-text files are small enough
+    that they come back as a single chunk.
+    """
+    filepath = Path(filepath)
+    ext = filepath.suffix.lower()
+    if ext == ".pdf":
+        yield from iter_pdf_pages(filepath)
+        return
+    yield extract_text(filepath)
+
+
 # ──────────────────────────────────────────────────────────────────────
 # Structured vocabulary detection & parsing
 # ──────────────────────────────────────────────────────────────────────
 
 # Separators we recognise, in priority order
-_SEPARATORS = ["\t", ";", "|", " - ", " – ", " — "]
+_CHAR_SEPARATORS = ["\t", ";", "|"]
+_DASH_SEPARATORS = [" - ", " – ", " — "]
 
-# Regex for lines that look like  "der Hund ; the dog"
+# Regex for lines that look like  "der Hund ; the dog".  The bounded
+# front field keeps the pattern from backtracking on degenerate lines.
 _STRUCTURED_LINE_RE = re.compile(
-    r"^[^;|\t\n]{2,}(?:[;|\t]| [-–—] )[^;|\t\n]{2,}$"
+    r"^[^;|\t\n]{2,80}(?:[;|\t]| [-–—] )[^;|\t\n]{2,}$"
 )
 
+# Sample size for the structured-list heuristic — a few hundred lines
+# give the same ratio as the full document within noise.
+_STRUCTURED_SAMPLE_LINES = 200
+
 
 def is_structured(text: str) -> bool:
     """Return True if the text looks like a structured vocabulary list.
 
     Heuristic: if ≥ 40 % of non-empty lines match the pattern
-    ``front <sep> back``, we treat it as structured.
+    ``front <sep> back``, we treat it as structured.  Only the first
+    ``_STRUCTURED_SAMPLE_LINES`` non-empty lines are inspected, with an
+    early exit once either outcome is decided.
     """
-    lines = [l.strip() for l in text.splitlines() if l.strip()]
-    if not lines:
+    # The sample lines fit comfortably in 64 KiB — slice first so
+    # splitlines() doesn't allocate a line list for the whole document.
+    if len(text) > 65536:
+        head = text[:65536]
+        cut = head.rfind("\n")  # drop the torn final line
+        text = head[:cut] if cut > 0 else head
+
+    match_needed = int(_STRUCTURED_SAMPLE_LINES * 0.4)
+    miss_allowed = _STRUCTURED_SAMPLE_LINES - match_needed
+
+    matched = total = 0
+    for raw_line in text.splitlines():
+        line = raw_line.strip()
+        if not line:
+            continue
+        total += 1
+        if _STRUCTURED_LINE_RE.match(line):
+            matched += 1
+            if matched >= match_needed:
+                break
+        elif total - matched > miss_allowed:
+            break
+        if total >= _STRUCTURED_SAMPLE_LINES:
+            break
+
+    if not total:
         return False
-    matched = sum(1 for l in lines if _STRUCTURED_LINE_RE.match(l))
-    ratio = matched / len(lines)
-    log.debug("Structured-line ratio: %.1f%% (%d/%d)", ratio * 100, matched, len(lines))
+    ratio = matched / total
+    log.debug("Structured-line ratio: %.1f%% (%d/%d)", ratio * 100, matched, total)
     return ratio >= 0.4
 
 
 def _detect_separator(text: str) -> str:
-    """Pick the most frequently occurring separator."""
+    """Pick the most frequently occurring separator.
+
+    Single-character separators come from one ``Counter`` histogram of
+    the text; the spaced-dash variants still need substring counting,
+    but their counts compete on equal footing — a dash-separated file
+    with one stray ``;`` must not detect ``;``.
+    """
+    hist = Counter(text)
     best_sep = ";"
     best_count = 0
-    for sep in _SEPARATORS:
+    for sep in _CHAR_SEPARATORS:
+        count = hist[sep]
+        if count > best_count:
+            best_count = count
+            best_sep = sep
+    for sep in _DASH_SEPARATORS:
         count = text.count(sep)
         if count > best_count:
             best_count = count
@@ -136,23 +290,39 @@ def parse_structured_vocab(text: str) -> List[Tuple[str, str]]:
     sep = _detect_separator(text)
     pairs: List[Tuple[str, str]] = []
 
-    for raw_line in text.splitlines():
-        line = raw_line.strip()
-        if not line or line.startswith("#"):
-            continue
-
-        if sep not in line:
-            continue
-
-        parts = line.split(sep, maxsplit=1)
-        if len(parts) != 2:
-            continue
-
-        front = parts[0].strip()
-        back = parts[1].strip()
-
-        if front and back:
-            pairs.append((front, back))
+    if len(sep) == 1:
+        # Single-character separator — let the C csv parser split rows.
+        reader = csv.reader(io.StringIO(text), delimiter=sep, quoting=csv.QUOTE_NONE)
+        for row in reader:
+            if len(row) < 2:
+                continue
+
+            front = row[0].strip()
+            if not front or front.startswith("#"):
+                continue
+
+            # Equivalent of split(sep, maxsplit=1): keep extra fields in back
+            back = sep.join(row[1:]).strip()
+            if back:
+                pairs.append((front, back))
+    else:
+        for raw_line in text.splitlines():
+            line = raw_line.strip()
+            if not line or line.startswith("#"):
+                continue
+
+            if sep not in line:
+                continue
+
+            parts = line.split(sep, maxsplit=1)
+            if len(parts) != 2:
+                continue
+
+            front = parts[0].strip()
+            back = parts[1].strip()
+
+            if front and back:
+                pairs.append((front, back))
 
     log.info("Parsed %d structured pairs (sep=%r)", len(pairs), sep)
     return pairs
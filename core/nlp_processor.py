@@ -9,10 +9,15 @@ nouns (capitalised words with article guessing), verbs and adjectives.
 
 from __future__ import annotations
 
+import hashlib
+import importlib.util
 import logging
+import pickle
 import re
+from collections import Counter
 from dataclasses import dataclass
-from typing import List
+from pathlib import Path
+from typing import Iterable, Iterator, List
 
 log = logging.getLogger(__name__)
 
@@ -56,11 +61,19 @@ _ADJ_ENDINGS = (
     "reich", "arm", "fest", "frei", "wert",
 )
 
+# Combined, precompiled suffix classifier: one anchored scan instead of
+# two tuple-endswith passes per word.  The two ending sets are disjoint,
+# so exactly one named group can match and ``lastgroup`` is the POS.
+_SUFFIX_RE = re.compile(
+    "(?:(?P<VERB>" + "|".join(sorted(_VERB_ENDINGS, key=len, reverse=True)) + ")"
+    "|(?P<ADJ>" + "|".join(_ADJ_ENDINGS) + "))$"
+)
+
 
 # ---------------------------------------------------------------------------
 # Result data class
 # ---------------------------------------------------------------------------
-@dataclass
+@dataclass(slots=True)
 class VocabEntry:
     word: str
     lemma: str
@@ -89,9 +102,20 @@ def _try_load_spacy():
         return None
     if _nlp is not None:
         return _nlp
+    # Cheap availability probe: a failed `import spacy` costs hundreds of
+    # milliseconds building the traceback, find_spec is a metadata lookup.
+    if (
+        importlib.util.find_spec("spacy") is None
+        or importlib.util.find_spec("de_core_news_sm") is None
+    ):
+        _SPACY_AVAILABLE = False
+        log.warning("spaCy / de_core_news_sm not installed; using regex fallback.")
+        return None
     try:
         import spacy
-        _nlp = spacy.load("de_core_news_sm")
+        # NER output is never consumed — excluding it skips a whole
+        # pipeline component per token.
+        _nlp = spacy.load("de_core_news_sm", exclude=["ner"])
         _SPACY_AVAILABLE = True
         log.info("spaCy loaded successfully")
         return _nlp
@@ -101,17 +125,32 @@ def _try_load_spacy():
         return None
 
 
-def _extract_with_spacy(text: str, min_freq: int) -> List[VocabEntry]:
+def _iter_chunks(text: str | Iterable[str], max_len: int) -> Iterator[str]:
+    """Yield NLP-sized chunks from a string or an iterable of strings.
+
+    Pages from a streamed PDF pass through as-is (they are natural chunk
+    boundaries); oversized pieces are split to respect ``nlp.max_length``.
+    """
+    parts = (text,) if isinstance(text, str) else text
+    for part in parts:
+        if len(part) <= max_len:
+            if part:
+                yield part
+        else:
+            for i in range(0, len(part), max_len):
+                yield part[i : i + max_len]
+
+
+def _extract_with_spacy(text: str | Iterable[str], min_freq: int) -> List[VocabEntry]:
     """Extract vocabulary using spaCy NLP."""
     nlp = _nlp  # already loaded by caller
     max_len = nlp.max_length
-    chunks = [text[i : i + max_len] for i in range(0, len(text), max_len)]
 
-    freq: dict[str, int] = {}
+    freq: Counter[str] = Counter()
     entries: dict[str, VocabEntry] = {}
 
-    for chunk in chunks:
-        doc = nlp(chunk)
+    for doc in nlp.pipe(_iter_chunks(text, max_len), batch_size=8):
+        has_sents = doc.has_annotation("SENT_START")
         for token in doc:
             if token.is_punct or token.is_space or token.is_digit:
                 continue
@@ -124,7 +163,7 @@ def _extract_with_spacy(text: str, min_freq: int) -> List[VocabEntry]:
 
             lemma = token.lemma_
             key = f"{pos}:{lemma.lower()}"
-            freq[key] = freq.get(key, 0) + 1
+            freq[key] += 1
 
             if key not in entries:
                 article = None
@@ -133,8 +172,9 @@ def _extract_with_spacy(text: str, min_freq: int) -> List[VocabEntry]:
                     if morph:
                         article = GENDER_ARTICLE_MAP.get(morph[0])
 
-                sent_text = token.sent.text.strip() if token.sent else ""
-                sent_text = re.sub(r"\s+", " ", sent_text)
+                # " ".join(split()) collapses runs of whitespace without
+                # the regex-engine round trip of re.sub(r"\s+", " ", ...)
+                sent_text = " ".join(token.sent.text.split()) if has_sents else ""
 
                 entries[key] = VocabEntry(
                     word=token.text if pos == "NOUN" else lemma,
@@ -151,25 +191,53 @@ def _extract_with_spacy(text: str, min_freq: int) -> List[VocabEntry]:
 #  FALLBACK PATH – regex + heuristics
 # ===================================================================
 
-# Regex: sequences of word-chars including German umlauts / ß
-_WORD_RE = re.compile(r"\b([A-ZÄÖÜa-zäöüß]{3,})\b")
+# Regex: sequences of word-chars including German umlauts / ß.
+# The third-party ``regex`` engine tokenizes large texts noticeably
+# faster than stdlib ``re`` and understands Unicode property classes;
+# fall back to ``re`` when it is not installed.
+try:
+    import regex as _word_re_engine
+
+    _WORD_RE = _word_re_engine.compile(r"\b[\p{Lu}\p{Ll}ß]{3,}\b")
+    _WORD_RE_ENGINE = "regex"
+except ImportError:
+    _WORD_RE = re.compile(r"\b[A-ZÄÖÜa-zäöüß]{3,}\b")
+    _WORD_RE_ENGINE = "re"
 # Sentence splitter (rough)
 _SENT_RE = re.compile(r"[^.!?]*[.!?]")
+# Capitalised word at the start of the text or right after a terminator
+_SENT_INITIAL_RE = re.compile(r"(?:^|[.!?]\s+)([A-ZÄÖÜ][A-Za-zÄÖÜäöüß]+)")
 
 
 def _extract_with_regex(text: str, min_freq: int) -> List[VocabEntry]:
     """Heuristic German vocabulary extraction without spaCy."""
     words = _WORD_RE.findall(text)
-    sentences = _SENT_RE.findall(text)
 
-    # Build a quick sentence lookup for example sentences
-    def _find_sentence(word: str) -> str:
-        for s in sentences:
-            if word in s:
-                return re.sub(r"\s+", " ", s.strip())[:300]
-        return ""
+    # One pass over the sentences, recording the first sentence each word
+    # occurs in.  The old per-word linear scan over the sentence list was
+    # O(unique words × sentences) on large documents.
+    first_sentence: dict[str, str] = {}
+    for sent_match in _SENT_RE.finditer(text):
+        sent = sent_match.group()
+        for word_match in _WORD_RE.finditer(sent):
+            first_sentence.setdefault(word_match.group(), sent)
 
-    freq: dict[str, int] = {}
+    def _find_sentence(word: str) -> str:
+        sent = first_sentence.get(word)
+        if sent is None:
+            return ""
+        return " ".join(sent.split())[:300]
+
+    # Precompute which capitalised words are (almost) always sentence-initial.
+    # Doing this once replaces a per-word regex compile + two full-text scans.
+    upper_total = Counter(w for w in words if w[0].isupper())
+    upper_starts = Counter(m.group(1) for m in _SENT_INITIAL_RE.finditer(text))
+    sentence_initial = {
+        w for w, n in upper_total.items()
+        if upper_starts.get(w, 0) / n > 0.8
+    }
+
+    freq: Counter[str] = Counter()
     entries: dict[str, VocabEntry] = {}
 
     for word in words:
@@ -178,25 +246,23 @@ def _extract_with_regex(text: str, min_freq: int) -> List[VocabEntry]:
             continue
 
         # Classify by heuristics
-        if word[0].isupper() and not _is_sentence_start(text, word):
+        if word[0].isupper() and word not in sentence_initial:
             # German nouns are capitalised
             pos = "NOUN"
-        elif low.endswith(_VERB_ENDINGS) and word[0].islower():
-            pos = "VERB"
-        elif low.endswith(_ADJ_ENDINGS) and word[0].islower():
-            pos = "ADJ"
         elif word[0].islower():
-            # Treat remaining lowercase long words as potential verbs/adj
-            # but only if they look "German enough"
-            if len(word) >= 5:
-                pos = "VERB"  # best guess
+            suffix = _SUFFIX_RE.search(low)
+            if suffix:
+                pos = suffix.lastgroup
+            elif len(word) >= 5:
+                # Remaining lowercase long words: best guess is verb/adj
+                pos = "VERB"
             else:
                 continue
         else:
             continue
 
         key = f"{pos}:{low}"
-        freq[key] = freq.get(key, 0) + 1
+        freq[key] += 1
 
         if key not in entries:
             entries[key] = VocabEntry(
@@ -210,20 +276,76 @@ def _extract_with_regex(text: str, min_freq: int) -> List[VocabEntry]:
     return [e for k, e in entries.items() if freq[k] >= min_freq]
 
 
-def _is_sentence_start(text: str, word: str) -> bool:
-    """Rough check: is *word* always at the start of a sentence?"""
-    pattern = re.compile(r"(?:^|[.!?]\s+)" + re.escape(word))
-    all_occurrences = len(re.findall(re.escape(word), text))
-    sentence_starts = len(pattern.findall(text))
-    # If >80 % of occurrences are sentence-initial, likely not a noun
-    return all_occurrences > 0 and sentence_starts / all_occurrences > 0.8
+# ===================================================================
+#  RESULT CACHE
+# ===================================================================
+
+def _backend_tag() -> str:
+    """Identify the extraction backend for cache keying.
+
+    Results cached by the regex fallback must not keep being served
+    once spaCy becomes available (or vice versa), and a model upgrade
+    or a tokenizer-engine change should likewise invalidate old
+    entries.  The caller resolves spaCy before asking for the tag.
+    """
+    if _nlp is not None:
+        return f"spacy-{_nlp.meta.get('version', '?')}"
+    return _WORD_RE_ENGINE
+
+
+def _cache_path(digest: str) -> Path | None:
+    """Return the on-disk cache file for *digest*, or None if unavailable."""
+    try:
+        from db.database import _app_data_dir
+        cache_dir = _app_data_dir() / "vocab_cache"
+        cache_dir.mkdir(exist_ok=True)
+    except OSError:
+        return None
+    return cache_dir / f"{digest}.pkl"
+
+
+# Keep only the most recently used cache entries; a typical library has
+# a handful of live source documents, not hundreds.
+_CACHE_MAX_FILES = 32
+
+
+def _load_cached(path: Path) -> List[VocabEntry] | None:
+    try:
+        with open(path, "rb") as f:
+            results = pickle.load(f)
+    except (OSError, pickle.PickleError, EOFError, AttributeError):
+        return None
+    try:
+        path.touch()  # refresh mtime so pruning is least-recently-used
+    except OSError:
+        pass
+    return results
+
+
+def _store_cached(path: Path, results: List[VocabEntry]) -> None:
+    try:
+        with open(path, "wb") as f:
+            pickle.dump(results, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        return
+    _prune_cache(path.parent)
+
+
+def _prune_cache(cache_dir: Path) -> None:
+    """Drop the oldest cache files beyond the ``_CACHE_MAX_FILES`` budget."""
+    try:
+        files = sorted(cache_dir.glob("*.pkl"), key=lambda p: p.stat().st_mtime)
+        for stale in files[:-_CACHE_MAX_FILES]:
+            stale.unlink(missing_ok=True)
+    except OSError:
+        pass
 
 
 # ===================================================================
 #  PUBLIC API
 # ===================================================================
 
-def extract_vocabulary(text: str, *, min_freq: int = 1) -> List[VocabEntry]:
+def extract_vocabulary(text: str | Iterable[str], *, min_freq: int = 1) -> List[VocabEntry]:
     """Analyse *text* and return a deduplicated list of German vocabulary.
 
     Automatically uses spaCy when available, otherwise falls back to a
@@ -231,8 +353,10 @@ def extract_vocabulary(text: str, *, min_freq: int = 1) -> List[VocabEntry]:
 
     Parameters
     ----------
-    text : str
-        Raw German text (from a PDF or TXT file).
+    text : str or iterable of str
+        Raw German text (from a PDF or TXT file).  An iterable of page
+        texts (see ``extractor.extract_text_stream``) is consumed
+        lazily, which keeps memory bounded for large PDFs.
     min_freq : int
         Minimum number of occurrences for a word to be included.
 
@@ -241,17 +365,47 @@ def extract_vocabulary(text: str, *, min_freq: int = 1) -> List[VocabEntry]:
     list[VocabEntry]
         Sorted by word type (NOUN → VERB → ADJ) then alphabetically.
     """
+    # Resolve the backend up front — it is part of the cache key.
     nlp = _try_load_spacy()
 
+    # Content-addressed cache: re-importing the same document is O(1).
+    # Streamed input (an iterator of pages) cannot be hashed without
+    # buffering, so only whole-string input is cached.
+    cache_file = None
+    if isinstance(text, str):
+        digest = hashlib.blake2b(
+            f"{_backend_tag()}:{min_freq}:{text}".encode("utf-8"), digest_size=16
+        ).hexdigest()
+        cache_file = _cache_path(digest)
+        if cache_file is not None and cache_file.exists():
+            cached = _load_cached(cache_file)
+            if cached is not None:
+                log.info("Vocabulary cache hit (%d entries)", len(cached))
+                return cached
+
     if nlp is not None:
         results = _extract_with_spacy(text, min_freq)
         log.info("Extracted %d entries via spaCy", len(results))
     else:
+        if not isinstance(text, str):
+            text = "\n".join(text)
         results = _extract_with_regex(text, min_freq)
         log.info("Extracted %d entries via regex fallback", len(results))
 
-    # Sort: NOUN first, then VERB, then ADJ; alphabetically within each group
-    type_order = {"NOUN": 0, "VERB": 1, "ADJ": 2}
-    results.sort(key=lambda e: (type_order.get(e.word_type, 9), e.lemma.lower()))
+    # Sort: NOUN first, then VERB, then ADJ; alphabetically within each
+    # group.  Bucketing by type first means each sort compares plain
+    # strings instead of building a (rank, lemma) tuple key per entry.
+    buckets: dict[str, List[VocabEntry]] = {"NOUN": [], "VERB": [], "ADJ": []}
+    rest: List[VocabEntry] = []
+    for entry in results:
+        buckets.get(entry.word_type, rest).append(entry)
+
+    results = []
+    for bucket in (buckets["NOUN"], buckets["VERB"], buckets["ADJ"], rest):
+        bucket.sort(key=lambda e: e.lemma.lower())
+        results.extend(bucket)
+
+    if cache_file is not None:
+        _store_cached(cache_file, results)
 
     return results
@@ -14,7 +14,8 @@ from typing import List, Tuple
 
 from sqlalchemy.orm import Session
 
-from db.database import get_session
+from core.srs_engine import invalidate_deck_stats
+from db.database import ScopedSession
 from db.models import Folder, Deck, Card, ReviewLog
 
 log = logging.getLogger(__name__)
@@ -24,7 +25,7 @@ log = logging.getLogger(__name__)
 
 def rename_folder(folder_id: int, new_name: str) -> bool:
     """Rename a folder. Returns True on success."""
-    s = get_session()
+    s = ScopedSession()
     try:
         f = s.get(Folder, folder_id)
         if not f:
@@ -34,12 +35,16 @@ def rename_folder(folder_id: int, new_name: str) -> bool:
         log.info("Renamed folder %d → %r", folder_id, f.name)
         return True
     finally:
-        s.close()
+        # Ends the read transaction on every path — the not-found early
+        # return would otherwise leave the shared session pinning an old
+        # WAL snapshot (and the open reader blocks checkpointing).
+        # A no-op after commit.
+        s.rollback()
 
 
 def rename_deck(deck_id: int, new_name: str) -> bool:
     """Rename a deck. Returns True on success."""
-    s = get_session()
+    s = ScopedSession()
     try:
         d = s.get(Deck, deck_id)
         if not d:
@@ -49,14 +54,14 @@ def rename_deck(deck_id: int, new_name: str) -> bool:
         log.info("Renamed deck %d → %r", deck_id, d.name)
         return True
     finally:
-        s.close()
+        s.rollback()  # end the transaction on every path; no-op after commit
 
 
 # ── Move ──────────────────────────────────────────────────────────────
 
 def move_deck(deck_id: int, target_folder_id: int) -> bool:
     """Move a deck to a different folder. Returns True on success."""
-    s = get_session()
+    s = ScopedSession()
     try:
         d = s.get(Deck, deck_id)
         tf = s.get(Folder, target_folder_id)
@@ -67,39 +72,41 @@ def move_deck(deck_id: int, target_folder_id: int) -> bool:
         log.info("Moved deck %d → folder %d", deck_id, target_folder_id)
         return True
     finally:
-        s.close()
+        s.rollback()  # end the transaction on every path; no-op after commit
 
 
 # ── Delete ────────────────────────────────────────────────────────────
 
 def delete_folder(folder_id: int) -> bool:
     """Delete a folder and everything inside (cascade)."""
-    s = get_session()
+    s = ScopedSession()
     try:
         f = s.get(Folder, folder_id)
         if not f:
             return False
         s.delete(f)
         s.commit()
+        invalidate_deck_stats()  # cascade may remove several decks
         log.info("Deleted folder %d", folder_id)
         return True
     finally:
-        s.close()
+        s.rollback()  # end the transaction on every path; no-op after commit
 
 
 def delete_deck(deck_id: int) -> bool:
     """Delete a deck and all its cards + logs (cascade)."""
-    s = get_session()
+    s = ScopedSession()
     try:
         d = s.get(Deck, deck_id)
         if not d:
             return False
         s.delete(d)
         s.commit()
+        invalidate_deck_stats(deck_id)
         log.info("Deleted deck %d", deck_id)
         return True
     finally:
-        s.close()
+        s.rollback()  # end the transaction on every path; no-op after commit
 
 
 # ── Reset progress ───────────────────────────────────────────────────
@@ -108,60 +115,88 @@ def reset_deck_progress(deck_id: int) -> int:
     """Reset all SM-2 fields for every card in a deck.
     Deletes all ReviewLogs. Returns number of cards reset."""
     now = datetime.now(timezone.utc)
-    s = get_session()
+    s = ScopedSession()
     try:
-        cards = s.query(Card).filter(Card.deck_id == deck_id).all()
-        for c in cards:
-            c.repetitions = 0
-            c.easiness = 2.5
-            c.interval = 0
-            c.next_review = now
-        # Delete all review logs for these cards
-        card_ids = [c.id for c in cards]
-        if card_ids:
-            s.query(ReviewLog).filter(ReviewLog.card_id.in_(card_ids)).delete(
-                synchronize_session="fetch"
+        # One bulk UPDATE instead of loading every card and flushing an
+        # UPDATE per object.
+        count = (
+            s.query(Card)
+            .filter(Card.deck_id == deck_id)
+            .update(
+                {
+                    Card.repetitions: 0,
+                    Card.easiness: 2.5,
+                    Card.interval: 0,
+                    Card.next_review: now,
+                },
+                synchronize_session=False,
             )
+        )
+        # Delete all review logs for these cards (subquery, no id fetch)
+        card_ids = s.query(Card.id).filter(Card.deck_id == deck_id)
+        s.query(ReviewLog).filter(ReviewLog.card_id.in_(card_ids)).delete(
+            synchronize_session=False
+        )
         s.commit()
-        log.info("Reset progress for deck %d (%d cards)", deck_id, len(cards))
-        return len(cards)
+        invalidate_deck_stats(deck_id)
+        log.info("Reset progress for deck %d (%d cards)", deck_id, count)
+        return count
     finally:
-        s.close()
+        s.rollback()  # end the transaction on every path; no-op after commit
 
 
 # ── Export ────────────────────────────────────────────────────────────
 
+_EXPORT_BATCH = 1000
+
+
 def export_deck_csv(deck_id: int, filepath: str) -> int:
-    """Export a deck's cards to CSV. Returns number of cards exported."""
-    s = get_session()
+    """Export a deck's cards to CSV. Returns number of cards exported.
+
+    Rows are streamed from SQLite in batches so huge decks never sit
+    fully in memory, and written through a 1 MiB file buffer.
+    """
+    s = ScopedSession()
     try:
-        cards = (
+        q = (
             s.query(Card)
             .filter(Card.deck_id == deck_id)
             .order_by(Card.id)
-            .all()
+            .yield_per(_EXPORT_BATCH)
         )
-        with open(filepath, "w", newline="", encoding="utf-8") as f:
+        count = 0
+        with open(filepath, "w", newline="", encoding="utf-8",
+                  buffering=1 << 20) as f:
             w = csv.writer(f)
             w.writerow(["front", "back", "article", "word_type", "example_sentence"])
-            for c in cards:
-                w.writerow([c.front, c.back or "", c.article or "",
-                            c.word_type or "", c.example_sentence or ""])
-        log.info("Exported %d cards from deck %d → %s", len(cards), deck_id, filepath)
-        return len(cards)
+            buf: list[tuple] = []
+            for c in q:
+                buf.append((c.front, c.back or "", c.article or "",
+                            c.word_type or "", c.example_sentence or ""))
+                if len(buf) >= _EXPORT_BATCH:
+                    w.writerows(buf)
+                    count += len(buf)
+                    buf.clear()
+            if buf:
+                w.writerows(buf)
+                count += len(buf)
+        log.info("Exported %d cards from deck %d → %s", count, deck_id, filepath)
+        return count
     finally:
-        s.close()
+        # End the read transaction so the shared session doesn't pin an
+        # old snapshot (WAL readers block checkpointing).
+        s.rollback()
 
 
 # ── Query helpers ─────────────────────────────────────────────────────
 
 def get_all_folders(exclude_id: int | None = None) -> List[Tuple[int, str]]:
     """Return [(id, name), ...] for all folders, optionally excluding one."""
-    s = get_session()
+    s = ScopedSession()
     try:
         q = s.query(Folder.id, Folder.name).order_by(Folder.name)
         if exclude_id is not None:
             q = q.filter(Folder.id != exclude_id)
         return q.all()
     finally:
-        s.close()
+        s.rollback()
@@ -8,9 +8,12 @@ flashcard reviews.
 from __future__ import annotations
 
 import logging
+import time
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import List, Tuple
 
+from sqlalchemy import case, func, select
 from sqlalchemy.orm import Session
 
 from db.models import Card, ReviewLog
@@ -48,6 +51,18 @@ def calculate_sm2(
     if quality < 0 or quality > 5:
         raise ValueError(f"quality must be 0-5, got {quality}")
 
+    # Memoized on (quality, reps, EF in thousandths, interval) — the same
+    # handful of states recurs constantly during a session or a batch
+    # reschedule, and the function is pure.
+    return _sm2_cached(quality, repetitions, round(easiness * 1000), interval)
+
+
+@lru_cache(maxsize=4096)
+def _sm2_cached(
+    quality: int, repetitions: int, ef_millis: int, interval: int
+) -> Tuple[int, float, int]:
+    easiness = ef_millis / 1000.0
+
     # Failed review — reset
     if quality < 3:
         new_repetitions = 0
@@ -90,6 +105,24 @@ def get_due_cards(session: Session, deck_id: int, *, limit: int = 50) -> List[Ca
     return cards
 
 
+def get_due_card_rows(session: Session, deck_id: int, *, limit: int = 50):
+    """Like :func:`get_due_cards`, but returns plain column rows.
+
+    For display-only consumers: no ORM instances are hydrated, so the
+    rows are cheap, immutable, and safe to keep after the session closes.
+    """
+    now = datetime.now(timezone.utc)
+    return session.execute(
+        select(
+            Card.id, Card.front, Card.back, Card.article,
+            Card.word_type, Card.example_sentence,
+        )
+        .where(Card.deck_id == deck_id, Card.next_review <= now)
+        .order_by(Card.next_review.asc())
+        .limit(limit)
+    ).all()
+
+
 def get_all_cards(session: Session, deck_id: int) -> List[Card]:
     """Return every card in a deck regardless of schedule."""
     return (
@@ -100,6 +133,40 @@ def get_all_cards(session: Session, deck_id: int) -> List[Card]:
     )
 
 
+def get_cards_page(session: Session, deck_id: int, *, last_id: int = 0, limit: int = 200):
+    """Return the next *limit* display rows after *last_id*, ordered by id.
+
+    Keyset pagination for the deck table: ``WHERE id > :last_id`` walks
+    the primary key directly, so later pages cost the same as the first
+    (no OFFSET scan) and the caller never holds more than one page plus
+    what it has already shown.
+
+    Rows come back already formatted for display (article prefix, em-dash
+    placeholder, two-decimal EF) — SQLite's concat and ``printf`` are C
+    code, so per-row Python string interpolation disappears.
+    """
+    front_text = case(
+        (Card.article.isnot(None), Card.article + " " + Card.front),
+        else_=Card.front,
+    ).label("front_text")
+    back_text = case((Card.back != "", Card.back), else_="—").label("back_text")
+    # Core execute, not Query: rows come back as lightweight tuples with
+    # no instrumented-attribute setup or identity-map entry per card.
+    return session.execute(
+        select(
+            Card.id,
+            front_text,
+            back_text,
+            func.coalesce(Card.word_type, "").label("word_type"),
+            func.printf("%d", Card.repetitions).label("reps"),
+            func.printf("%.2f", Card.easiness).label("ef"),
+        )
+        .where(Card.deck_id == deck_id, Card.id > last_id)
+        .order_by(Card.id)
+        .limit(limit)
+    ).all()
+
+
 # ---------------------------------------------------------------------------
 # Review recording
 # ---------------------------------------------------------------------------
@@ -126,6 +193,7 @@ def record_review(session: Session, card: Card, quality: int) -> Card:
     )
     session.add(log_entry)
     session.commit()
+    invalidate_deck_stats(card.deck_id)
 
     log.info(
         "Reviewed card %d (q=%d) → reps=%d ef=%.2f interval=%d next=%s",
@@ -138,18 +206,42 @@ def record_review(session: Session, card: Card, quality: int) -> Card:
 # Deck-level statistics
 # ---------------------------------------------------------------------------
 
+# Process-local stats cache.  The sidebar and deck header both ask for
+# the same numbers on every refresh; aggregating per call is O(cards)
+# per deck.  Entries are invalidated on review/reset and expire after a
+# short TTL anyway, since "due" drifts as the clock advances.
+_STATS_TTL = 30.0  # seconds
+_stats_cache: dict[int, tuple[float, dict]] = {}
+
+
+def invalidate_deck_stats(deck_id: int | None = None) -> None:
+    """Drop cached stats for one deck, or all decks when *deck_id* is None."""
+    if deck_id is None:
+        _stats_cache.clear()
+    else:
+        _stats_cache.pop(deck_id, None)
+
+
 def deck_stats(session: Session, deck_id: int) -> dict:
-    """Return quick stats for a deck: total, due, mastered counts."""
+    """Return quick stats for a deck: total, due, mastered counts.
+
+    One conditional-aggregate query instead of three COUNTs — the table
+    is walked once.  Results are cached per deck for a short TTL.
+    """
+    cached = _stats_cache.get(deck_id)
+    if cached is not None and time.monotonic() - cached[0] < _STATS_TTL:
+        return cached[1]
+
     now = datetime.now(timezone.utc)
-    total = session.query(Card).filter(Card.deck_id == deck_id).count()
-    due = (
-        session.query(Card)
-        .filter(Card.deck_id == deck_id, Card.next_review <= now)
-        .count()
-    )
-    mastered = (
-        session.query(Card)
-        .filter(Card.deck_id == deck_id, Card.repetitions >= 5)
-        .count()
+    total, due, mastered = (
+        session.query(
+            func.count(Card.id),
+            func.coalesce(func.sum(case((Card.next_review <= now, 1), else_=0)), 0),
+            func.coalesce(func.sum(case((Card.repetitions >= 5, 1), else_=0)), 0),
+        )
+        .filter(Card.deck_id == deck_id)
+        .one()
     )
-    return {"total": total, "due": due, "mastered": mastered, "learning": total - mastered}
+    stats = {"total": total, "due": due, "mastered": mastered, "learning": total - mastered}
+    _stats_cache[deck_id] = (time.monotonic(), stats)
+    return stats
@@ -10,7 +10,7 @@ import sys
 from pathlib import Path
 
 from sqlalchemy import create_engine, event
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.orm import sessionmaker, scoped_session, Session
 
 from db.models import Base
 
@@ -33,21 +33,71 @@ def _app_data_dir() -> Path:
 DB_PATH = _app_data_dir() / "vocabrecall.db"
 DATABASE_URL = f"sqlite:///{DB_PATH}"
 
+# Single process-wide engine. Keeping a small fixed pool of warm
+# connections matters here because every *new* connection re-runs the
+# PRAGMA listener below; reuse skips that setup cost entirely.
 engine = create_engine(
     DATABASE_URL,
     echo=False,
+    pool_size=5,
+    max_overflow=0,
     connect_args={"check_same_thread": False},
 )
 
 
 @event.listens_for(engine, "connect")
 def _set_sqlite_pragma(dbapi_conn, connection_record):
-    """Enable foreign key enforcement for every SQLite connection."""
+    """Enforce foreign keys and tune SQLite for this read-heavy workload."""
     cursor = dbapi_conn.cursor()
     cursor.execute("PRAGMA foreign_keys=ON")
+    # WAL lets readers proceed during writes; NORMAL sync is safe in WAL
+    # mode and skips an fsync per transaction.  (WAL needs a real file —
+    # skip it for in-memory databases.)
+    if DB_PATH.name != ":memory:":
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+    # 256 MiB mmap window + 64 MiB page cache keep due-card queries and
+    # deck stats off the read() syscall path.
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.execute("PRAGMA cache_size=-65536")
+    cursor.execute("PRAGMA temp_store=MEMORY")
     cursor.close()
 
+# Dedicated read-only engine for the UI's browse paths.  Its single
+# long-lived connection runs with query_only set, so under WAL it reads
+# concurrently with the writer and never competes for the write lock.
+_reader_engine = create_engine(
+    DATABASE_URL,
+    echo=False,
+    pool_size=1,
+    max_overflow=0,
+    connect_args={"check_same_thread": False},
+)
+
+
+@event.listens_for(_reader_engine, "connect")
+def _set_reader_pragma(dbapi_conn, connection_record):
+    """Mark reader connections read-only and apply the same cache tuning.
+
+    journal_mode is deliberately not touched here: WAL is persistent in
+    the database file and a query_only connection may not change it.
+    """
+    cursor = dbapi_conn.cursor()
+    cursor.execute("PRAGMA query_only=1")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.execute("PRAGMA cache_size=-65536")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
+
 SessionLocal = sessionmaker(bind=engine, expire_on_commit=False)
+ReaderSession = sessionmaker(bind=_reader_engine, expire_on_commit=False)
+
+# Thread-local session registry for modules that fire many small,
+# independent operations (e.g. sidebar folder/deck management). Reusing
+# one Session per thread avoids paying session construction and
+# connection checkout on every call.
+ScopedSession = scoped_session(SessionLocal)
 
 
 # ---------------------------------------------------------------------------
@@ -55,10 +105,38 @@ SessionLocal = sessionmaker(bind=engine, expire_on_commit=False)
 # ---------------------------------------------------------------------------
 
 def init_db() -> None:
-    """Create all tables if they do not exist yet."""
+    """Create all tables — and any later-added indexes — if missing.
+
+    ``create_all`` skips tables that already exist, so indexes declared
+    after a user's database was first created would otherwise never
+    materialize on that install.  Creating each index with
+    ``checkfirst`` covers legacy databases without a migration step.
+    """
     Base.metadata.create_all(bind=engine)
+    for table in Base.metadata.tables.values():
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
 
 
 def get_session() -> Session:
     """Return a new SQLAlchemy session."""
     return SessionLocal()
+
+
+def get_reader_session() -> Session:
+    """Return a session on the read-only connection.
+
+    For browse/display queries only — any flush fails with
+    "attempt to write a readonly database".
+    """
+    return ReaderSession()
+
+
+def optimize_db() -> None:
+    """Run ``PRAGMA optimize`` so the query planner keeps fresh statistics.
+
+    SQLite recommends running this periodically and on close; the call is
+    cheap (it analyzes only what changed since the last run).
+    """
+    with engine.connect() as conn:
+        conn.exec_driver_sql("PRAGMA optimize")
@@ -15,6 +15,7 @@ from sqlalchemy import (
     Text,
     DateTime,
     ForeignKey,
+    Index,
     UniqueConstraint,
 )
 from sqlalchemy.orm import declarative_base, relationship
@@ -34,11 +35,13 @@ class Folder(Base):
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
 
     # Relationships
+    # selectin: the sidebar walks the whole tree — one SELECT ... IN (...)
+    # per level instead of one lazy query per folder (N+1).
     children = relationship(
         "Folder",
         back_populates="parent",
         cascade="all, delete-orphan",
-        lazy="select",
+        lazy="selectin",
         passive_deletes=True,
         single_parent=True,
         foreign_keys=[parent_id],
@@ -50,7 +53,11 @@ class Folder(Base):
         foreign_keys=[parent_id],
     )
     decks = relationship(
-        "Deck", back_populates="folder", cascade="all, delete-orphan", passive_deletes=True
+        "Deck",
+        back_populates="folder",
+        cascade="all, delete-orphan",
+        lazy="selectin",
+        passive_deletes=True,
     )
 
     __table_args__ = (
@@ -69,7 +76,9 @@ class Deck(Base):
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     name = Column(String(255), nullable=False)
-    folder_id = Column(Integer, ForeignKey("folders.id", ondelete="CASCADE"), nullable=False)
+    folder_id = Column(
+        Integer, ForeignKey("folders.id", ondelete="CASCADE"), nullable=False, index=True
+    )
     source_filename = Column(String(512), nullable=True)
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
 
@@ -113,6 +122,12 @@ class Card(Base):
         "ReviewLog", back_populates="card", cascade="all, delete-orphan", passive_deletes=True
     )
 
+    # One composite index serves both the plain deck_id filters (prefix)
+    # and the due-card range scan on (deck_id, next_review).
+    __table_args__ = (
+        Index("ix_cards_deck_next_review", "deck_id", "next_review"),
+    )
+
     def __repr__(self) -> str:
         return f"<Card id={self.id} front={self.front!r} next_review={self.next_review}>"
 
@@ -124,7 +139,9 @@ class ReviewLog(Base):
     __tablename__ = "review_logs"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    card_id = Column(Integer, ForeignKey("cards.id", ondelete="CASCADE"), nullable=False)
+    card_id = Column(
+        Integer, ForeignKey("cards.id", ondelete="CASCADE"), nullable=False, index=True
+    )
     reviewed_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
     quality = Column(Integer, nullable=False)  # 0-5 (SM-2 scale)
     easiness_after = Column(Float, nullable=True)
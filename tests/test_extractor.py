@@ -7,7 +7,13 @@ import tempfile
 import pytest
 from pathlib import Path
 
-from core.extractor import extract_text_from_txt, extract_text
+from core.extractor import (
+    _detect_separator,
+    extract_text,
+    extract_text_from_txt,
+    is_structured,
+    parse_structured_vocab,
+)
 
 
 class TestTxtExtraction:
@@ -34,3 +40,66 @@ class TestExtractDispatch:
         f.write_text("a,b,c", encoding="utf-8")
         with pytest.raises(ValueError, match="Unsupported"):
             extract_text(str(f))
+
+
+class TestDetectSeparator:
+    def test_semicolon(self):
+        assert _detect_separator("das Haus ; the house\nder Hund ; the dog") == ";"
+
+    def test_tab_beats_semicolon(self):
+        text = "\n".join(f"Wort{i}\tword{i}; also word{i}" for i in range(10))
+        assert _detect_separator(text) == "\t"
+
+    def test_dash_beats_stray_semicolon(self):
+        """A dash-separated file with one embedded ';' must detect the dash."""
+        lines = [f"Wort{i} - word{i}" for i in range(50)]
+        lines[3] = "Wort3 - word3; also word3"
+        assert _detect_separator("\n".join(lines)) == " - "
+
+
+class TestParseStructuredVocab:
+    def test_semicolon_pairs(self):
+        pairs = parse_structured_vocab("das Haus ; the house\nder Hund ; the dog")
+        assert pairs == [("das Haus", "the house"), ("der Hund", "the dog")]
+
+    def test_comments_and_blank_lines_skipped(self):
+        text = "# Kapitel 1\n\ndas Haus ; the house\n# noch ein Kommentar\n"
+        assert parse_structured_vocab(text) == [("das Haus", "the house")]
+
+    def test_extra_fields_stay_in_back(self):
+        pairs = parse_structured_vocab("groß ; big ; tall\nklein ; small")
+        assert pairs == [("groß", "big ; tall"), ("klein", "small")]
+
+    def test_dash_separated(self):
+        lines = [f"Wort{i} - word{i}" for i in range(50)]
+        lines[0] = "Wort0 - word0; also word0"
+        pairs = parse_structured_vocab("\n".join(lines))
+        assert len(pairs) == 50
+        assert pairs[0] == ("Wort0", "word0; also word0")
+
+    def test_lines_without_separator_skipped(self):
+        pairs = parse_structured_vocab("das Haus ; the house\nkein Paar hier")
+        assert pairs == [("das Haus", "the house")]
+
+
+class TestIsStructured:
+    def test_vocab_list_is_structured(self):
+        text = "\n".join(f"das Wort{i} ; the word {i}" for i in range(20))
+        assert is_structured(text)
+
+    def test_prose_is_not_structured(self):
+        text = "\n".join(
+            "Das ist ein ganz normaler deutscher Satz ohne Trenner."
+            for _ in range(20)
+        )
+        assert not is_structured(text)
+
+    def test_empty_text(self):
+        assert not is_structured("")
+
+    def test_decision_from_leading_sample(self):
+        """Only the leading sample is inspected — prose past the first
+        64 KiB / 200 lines cannot flip a structured head."""
+        head = "\n".join(f"das Wort{i} ; the word {i}" for i in range(300))
+        tail = "Nur Prosa ohne Trenner hier. " * 5000  # well past 64 KiB
+        assert is_structured(head + "\n" + tail)
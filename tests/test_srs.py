@@ -3,7 +3,7 @@ Tests for the SM-2 spaced-repetition algorithm.
 """
 
 import pytest
-from core.srs_engine import calculate_sm2
+from core.srs_engine import _sm2_cached, calculate_sm2
 
 
 class TestCalculateSM2:
@@ -51,3 +51,29 @@ class TestCalculateSM2:
             calculate_sm2(quality=6, repetitions=0, easiness=2.5, interval=0)
         with pytest.raises(ValueError):
             calculate_sm2(quality=-1, repetitions=0, easiness=2.5, interval=0)
+
+
+class TestSM2Memoization:
+    """The lru_cache layer must be invisible to callers."""
+
+    def test_cached_call_matches_fresh_computation(self):
+        states = [
+            (q, reps, ef, interval)
+            for q in range(6)
+            for reps in (0, 1, 2, 7)
+            for ef in (1.3, 2.5, 2.8)
+            for interval in (0, 1, 6, 30)
+        ]
+        fresh = [calculate_sm2(*s) for s in states]
+        # Second pass hits the cache for every state.
+        assert [calculate_sm2(*s) for s in states] == fresh
+        # And a cleared cache recomputes to the same values.
+        _sm2_cached.cache_clear()
+        assert [calculate_sm2(*s) for s in states] == fresh
+
+    def test_ef_rounding_keeps_distinct_states_apart(self):
+        """EF is bucketed to thousandths for the cache key — values that
+        differ at that granularity must not collide."""
+        low = calculate_sm2(quality=5, repetitions=2, easiness=2.000, interval=10)
+        high = calculate_sm2(quality=5, repetitions=2, easiness=2.001, interval=10)
+        assert low[1] != high[1]
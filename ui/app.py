@@ -7,9 +7,11 @@ dialog into a single CustomTkinter application.
 
 from __future__ import annotations
 
+import threading
+
 import customtkinter as ctk
 
-from db.database import init_db
+from db.database import init_db, optimize_db
 from ui.widgets import Theme
 from ui.sidebar import Sidebar
 from ui.deck_view import DeckView
@@ -36,20 +38,24 @@ class VocabRecallApp(ctk.CTk):
         ctk.set_appearance_mode("dark")
         ctk.set_default_color_theme("blue")
 
-        # Ensure database tables exist
-        init_db()
+        # Ensure database tables exist — run the DDL on a worker thread so
+        # the window paints immediately instead of waiting for schema
+        # creation and connection PRAGMAs.
+        self._db_ready = threading.Event()
+        threading.Thread(target=self._init_db_worker, daemon=True).start()
 
         # ── Layout: sidebar | content ──
         self.grid_rowconfigure(0, weight=1)
         self.grid_columnconfigure(1, weight=1)
 
-        # Sidebar
-        self._sidebar = Sidebar(
-            self,
-            on_deck_select=self._on_deck_select,
-            on_import=self._on_import,
+        # Sidebar placeholder until the database is ready; the real
+        # sidebar issues queries on construction, so it must wait.
+        self._sidebar: Sidebar | None = None
+        self._sidebar_loading = ctk.CTkLabel(
+            self, text="Loading…", text_color=Theme.TEXT_MUTED, width=220
         )
-        self._sidebar.grid(row=0, column=0, sticky="ns")
+        self._sidebar_loading.grid(row=0, column=0, sticky="ns")
+        self.after(50, self._check_db_ready)
 
         # Content frame
         self._content = ctk.CTkFrame(self, fg_color=Theme.BG_DARK, corner_radius=0)
@@ -64,6 +70,29 @@ class VocabRecallApp(ctk.CTk):
         self._current_deck_id: int | None = None
         self._study_window: StudySessionView | None = None
 
+        self.protocol("WM_DELETE_WINDOW", self._on_app_close)
+
+    # ------------------------------------------------------------------
+    # Startup
+    # ------------------------------------------------------------------
+
+    def _init_db_worker(self) -> None:
+        init_db()
+        self._db_ready.set()
+
+    def _check_db_ready(self) -> None:
+        """Poll until the worker finishes, then build the real sidebar."""
+        if not self._db_ready.is_set():
+            self.after(50, self._check_db_ready)
+            return
+        self._sidebar_loading.destroy()
+        self._sidebar = Sidebar(
+            self,
+            on_deck_select=self._on_deck_select,
+            on_import=self._on_import,
+        )
+        self._sidebar.grid(row=0, column=0, sticky="ns")
+
     # ------------------------------------------------------------------
     # Callbacks
     # ------------------------------------------------------------------
@@ -107,4 +136,22 @@ class VocabRecallApp(ctk.CTk):
         self._sidebar.refresh()
         if self._current_deck_id:
             self._deck_view.show_deck(self._current_deck_id)
+        # Refresh planner statistics after the bulk insert, off the UI thread
+        threading.Thread(target=optimize_db, daemon=True).start()
+
+    def _on_app_close(self) -> None:
+        """Flush any open study session, refresh planner stats, quit."""
+        # destroy() tears down child Toplevels without firing their
+        # WM_DELETE_WINDOW handlers — flush the study window's pending
+        # reviews explicitly or they would be lost.
+        if self._study_window is not None and self._study_window.winfo_exists():
+            try:
+                self._study_window._flush_reviews()
+            except Exception:
+                pass
+        try:
+            optimize_db()
+        except Exception:
+            pass
+        self.destroy()
 
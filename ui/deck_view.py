@@ -7,18 +7,34 @@ a "Study" button to launch the flashcard game.
 
 from __future__ import annotations
 
+import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable
 
 import customtkinter as ctk
+from sqlalchemy import select
 
-from db.database import get_session
-from db.models import Deck, Card
-from core.srs_engine import deck_stats, get_all_cards
+from db.database import get_reader_session
+from db.models import Deck
+from core.srs_engine import deck_stats, get_cards_page
 from ui.widgets import Theme, AccentButton, StatCard, Separator
 
 
 class DeckView(ctk.CTkFrame):
-    """Content panel that shows deck metadata, stats, and card list."""
+    """Content panel that shows deck metadata, stats, and card list.
+
+    The card table is virtualized: a plain canvas carries the scrollregion
+    for the whole deck, but only a small pool of row widgets ever exists —
+    they are repositioned and retexted as the user scrolls.
+    """
+
+    _ROW_HEIGHT = 40   # row frame (36) + pack padding
+    _ROW_POOL = 40     # initial size; grows with the viewport on resize
+    _PAGE_SIZE = 200   # cards fetched per keyset page
+
+    # Shared worker pool for deck reads; each job opens its own session
+    # and hands finished data back to the Tk thread via after(0, ...).
+    _EXEC = ThreadPoolExecutor(max_workers=2)
 
     def __init__(
         self,
@@ -32,46 +48,155 @@ class DeckView(ctk.CTkFrame):
 
         self._on_study = on_study
         self._deck_id: int | None = None
+        self._cards_data: list = []
+        self._all_loaded = True
+        self._fetching = False
+        self._row_pool: list[tuple[int, list[ctk.CTkLabel]]] = []
+        self._slot_index: list[int] = []
+
+        # Fonts are Tk-side resources — build each variant once and reuse
+        # it across every rebuild instead of allocating one per label.
+        self._font_placeholder = ctk.CTkFont(family=Theme.FONT_FAMILY, size=15)
+        self._font_title = ctk.CTkFont(family=Theme.FONT_FAMILY, size=22, weight="bold")
+        self._font_body = ctk.CTkFont(family=Theme.FONT_FAMILY, size=14)
+        self._font_small = ctk.CTkFont(family=Theme.FONT_FAMILY, size=12)
+        self._font_col_header = ctk.CTkFont(family=Theme.FONT_FAMILY, size=12, weight="bold")
+        self._font_row = ctk.CTkFont(family=Theme.FONT_FAMILY, size=13)
 
         # ── Placeholder ──
         self._placeholder = ctk.CTkLabel(
             self,
             text="← Select a deck from the sidebar to view its cards",
-            font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=15),
+            font=self._font_placeholder,
             text_color=Theme.TEXT_MUTED,
         )
         self._placeholder.pack(expand=True)
 
+        # ── Persistent scaffolding ──
+        # Header container, table chrome, canvas, and the full row pool
+        # are created ONCE here and merely reconfigured on every deck
+        # switch: .configure(text=...) is an order of magnitude cheaper
+        # than rebuilding the widgets.
+        self._header_area = ctk.CTkFrame(self, fg_color="transparent")
+
+        self._empty_lbl = ctk.CTkLabel(
+            self,
+            text="No cards yet. Import a file to generate vocabulary.",
+            font=self._font_body,
+            text_color=Theme.TEXT_MUTED,
+        )
+
+        self._list_wrap = ctk.CTkFrame(self, fg_color="transparent")
+        hdr = ctk.CTkFrame(self._list_wrap, fg_color=Theme.BG_CARD, corner_radius=8, height=36)
+        hdr.pack(fill="x", pady=(0, 6))
+        for col, w in [("Front", 200), ("Back", 200), ("Type", 80), ("Reps", 60), ("EF", 60)]:
+            ctk.CTkLabel(
+                hdr, text=col, width=w,
+                font=self._font_col_header,
+                text_color=Theme.TEXT_MUTED,
+            ).pack(side="left", padx=8, pady=6)
+
+        body = ctk.CTkFrame(self._list_wrap, fg_color="transparent")
+        body.pack(fill="both", expand=True)
+
+        self._canvas = tk.Canvas(body, bg=Theme.BG_DARK, highlightthickness=0, bd=0)
+        sb = ctk.CTkScrollbar(
+            body, command=self._canvas.yview,
+            button_color=Theme.BORDER, button_hover_color=Theme.ACCENT,
+        )
+        sb.pack(side="right", fill="y")
+        self._canvas.pack(side="left", fill="both", expand=True)
+        self._canvas.configure(
+            yscrollcommand=lambda a, b: (sb.set(a, b), self._update_visible_rows()),
+        )
+        self._canvas.bind("<Configure>", self._on_canvas_resize)
+        self._canvas.bind("<MouseWheel>", self._on_mousewheel)
+        self._canvas.bind("<Button-4>", self._on_mousewheel)
+        self._canvas.bind("<Button-5>", self._on_mousewheel)
+
+        self._canvas_width = 0
+        for _ in range(self._ROW_POOL):
+            self._add_pool_row()
+
+    def _add_pool_row(self) -> None:
+        frame = ctk.CTkFrame(
+            self._canvas, fg_color=Theme.BG_CARD, corner_radius=8, height=36
+        )
+        labels: list[ctk.CTkLabel] = []
+        for w in (200, 200, 80, 60, 60):
+            lbl = ctk.CTkLabel(
+                frame, text="", width=w,
+                font=self._font_row,
+                text_color=Theme.TEXT_PRIMARY,
+                anchor="w",
+            )
+            lbl.pack(side="left", padx=8, pady=6)
+            labels.append(lbl)
+        for widget in (frame, *labels):
+            widget.bind("<MouseWheel>", self._on_mousewheel)
+            widget.bind("<Button-4>", self._on_mousewheel)
+            widget.bind("<Button-5>", self._on_mousewheel)
+        item = self._canvas.create_window(
+            0, 0, window=frame, anchor="nw", height=36, state="hidden"
+        )
+        if self._canvas_width:
+            self._canvas.itemconfigure(item, width=self._canvas_width)
+        self._row_pool.append((item, labels))
+        self._slot_index.append(-1)
+
     # ------------------------------------------------------------------
     # Public
     # ------------------------------------------------------------------
 
     def show_deck(self, deck_id: int) -> None:
-        """Populate the view with a specific deck's data."""
+        """Populate the view with a specific deck's data.
+
+        The database read runs on the worker pool so the window keeps
+        repainting during a large deck load; rendering happens back on
+        the Tk thread once the data arrives.
+        """
         self._deck_id = deck_id
-        self._placeholder.pack_forget()
-        for w in self.winfo_children():
-            w.destroy()
+        self._EXEC.submit(self._load_deck_data, deck_id)
 
-        session = get_session()
-        try:
-            deck = session.get(Deck, deck_id)
+    def _load_deck_data(self, deck_id: int) -> None:
+        with get_reader_session() as session:
+            # Plain column select: the header only needs three fields, and a
+            # Row can't trip a lazy relationship load after the session closes.
+            deck = session.execute(
+                select(Deck.id, Deck.name, Deck.source_filename)
+                .where(Deck.id == deck_id)
+            ).first()
             if not deck:
                 return
             stats = deck_stats(session, deck_id)
-            cards = get_all_cards(session, deck_id)
-        finally:
-            session.close()
+            cards = get_cards_page(session, deck_id, limit=self._PAGE_SIZE)
+        self.after(0, self._render_deck, deck_id, deck, stats, cards)
+
+    def _render_deck(self, deck_id: int, deck, stats: dict, cards: list) -> None:
+        if deck_id != self._deck_id:
+            return  # user already clicked another deck
+        self._all_loaded = len(cards) < self._PAGE_SIZE
+
+        # Unmap the frame while its children are swapped so the geometry
+        # manager does a single relayout on remap instead of one per
+        # widget change.  Only the header is rebuilt; the table chrome,
+        # canvas, and row pool persist and are merely reconfigured.
+        self.grid_remove()
+        self._placeholder.pack_forget()
+        for w in self._header_area.winfo_children():
+            w.destroy()
+        self._header_area.pack(fill="x")
 
         self._build_header(deck, stats)
         self._build_card_list(cards)
+        self.after_idle(self.grid)
 
     # ------------------------------------------------------------------
     # Internal builders
     # ------------------------------------------------------------------
 
-    def _build_header(self, deck: Deck, stats: dict) -> None:
-        header = ctk.CTkFrame(self, fg_color="transparent")
+    def _build_header(self, deck, stats: dict) -> None:
+        header = ctk.CTkFrame(self._header_area, fg_color="transparent")
         header.pack(fill="x", padx=28, pady=(24, 0))
 
         # Title row
@@ -81,7 +206,7 @@ class DeckView(ctk.CTkFrame):
         ctk.CTkLabel(
             title_row,
             text=f"🃏  {deck.name}",
-            font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=22, weight="bold"),
+            font=self._font_title,
             text_color=Theme.TEXT_PRIMARY,
         ).pack(side="left")
 
@@ -96,7 +221,7 @@ class DeckView(ctk.CTkFrame):
             ctk.CTkLabel(
                 title_row,
                 text="✅  All caught up!",
-                font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=14),
+                font=self._font_body,
                 text_color=Theme.SUCCESS,
             ).pack(side="right", padx=8)
 
@@ -105,7 +230,7 @@ class DeckView(ctk.CTkFrame):
             ctk.CTkLabel(
                 header,
                 text=f"Source: {deck.source_filename}",
-                font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=12),
+                font=self._font_small,
                 text_color=Theme.TEXT_MUTED,
             ).pack(anchor="w", pady=(4, 0))
 
@@ -122,61 +247,110 @@ class DeckView(ctk.CTkFrame):
             sc = StatCard(stat_row, label=label, value=value, color=color)
             sc.pack(side="left", padx=(0, 12), fill="x", expand=True)
 
-        Separator(self).pack(fill="x", padx=28, pady=(20, 0))
+        Separator(self._header_area).pack(fill="x", padx=28, pady=(20, 0))
+
+    def _build_card_list(self, cards: list) -> None:
+        self._cards_data = cards
+        self._slot_index = [-1] * len(self._row_pool)
 
-    def _build_card_list(self, cards: list[Card]) -> None:
         if not cards:
-            ctk.CTkLabel(
-                self,
-                text="No cards yet. Import a file to generate vocabulary.",
-                font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=14),
-                text_color=Theme.TEXT_MUTED,
-            ).pack(pady=40)
+            self._list_wrap.pack_forget()
+            self._empty_lbl.pack(pady=40)
             return
 
-        scroll = ctk.CTkScrollableFrame(
-            self, fg_color="transparent",
-            scrollbar_button_color=Theme.BORDER,
-            scrollbar_button_hover_color=Theme.ACCENT,
+        self._empty_lbl.pack_forget()
+        self._list_wrap.pack(fill="both", expand=True, padx=24, pady=12)
+        self._canvas.configure(
+            scrollregion=(0, 0, 0, len(cards) * self._ROW_HEIGHT)
         )
-        scroll.pack(fill="both", expand=True, padx=24, pady=12)
+        self._canvas.yview_moveto(0)
+        self._update_visible_rows()
 
-        # Column headers
-        hdr = ctk.CTkFrame(scroll, fg_color=Theme.BG_CARD, corner_radius=8, height=36)
-        hdr.pack(fill="x", pady=(0, 6))
-        for col, w in [("Front", 200), ("Back", 200), ("Type", 80), ("Reps", 60), ("EF", 60)]:
-            ctk.CTkLabel(
-                hdr, text=col, width=w,
-                font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=12, weight="bold"),
-                text_color=Theme.TEXT_MUTED,
-            ).pack(side="left", padx=8, pady=6)
+    # ── Virtual-list plumbing ──────────────────────────────────────────
+
+    def _update_visible_rows(self) -> None:
+        """Recycle the pooled rows onto the slice of cards now in view."""
+        canvas = self._canvas
+        if not self._row_pool:
+            return
+        first = int(canvas.canvasy(0) // self._ROW_HEIGHT)
+        first = max(0, min(first, max(0, len(self._cards_data) - len(self._row_pool))))
 
-        for card in cards:
-            row = ctk.CTkFrame(scroll, fg_color=Theme.BG_CARD, corner_radius=8, height=36)
-            row.pack(fill="x", pady=2)
-
-            front_text = f"{card.article} {card.front}" if card.article else card.front
-            for text, w in [
-                (front_text, 200),
-                (card.back or "—", 200),
-                (card.word_type or "", 80),
-                (str(card.repetitions), 60),
-                (f"{card.easiness:.2f}", 60),
-            ]:
-                ctk.CTkLabel(
-                    row, text=text, width=w,
-                    font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=13),
-                    text_color=Theme.TEXT_PRIMARY,
-                    anchor="w",
-                ).pack(side="left", padx=8, pady=6)
+        if not self._all_loaded and first + 2 * len(self._row_pool) >= len(self._cards_data):
+            self._fetch_next_page()
+
+        for slot, (item, labels) in enumerate(self._row_pool):
+            idx = first + slot
+            if idx >= len(self._cards_data):
+                canvas.itemconfigure(item, state="hidden")
+                self._slot_index[slot] = -1
+                continue
+            canvas.coords(item, 0, idx * self._ROW_HEIGHT)
+            if self._slot_index[slot] == idx:
+                continue
+            self._slot_index[slot] = idx
+            canvas.itemconfigure(item, state="normal")
+            # Rows arrive pre-formatted from SQL — no per-row interpolation.
+            for lbl, value in zip(labels, self._cards_data[idx][1:]):
+                lbl.configure(text=value)
+
+    def _fetch_next_page(self) -> None:
+        """Kick off a background fetch of the next keyset page."""
+        if self._fetching or not self._cards_data:
+            return
+        self._fetching = True
+        deck_id = self._deck_id
+        last_id = self._cards_data[-1].id
+        self._EXEC.submit(self._load_page, deck_id, last_id)
+
+    def _load_page(self, deck_id: int, last_id: int) -> None:
+        with get_reader_session() as session:
+            page = get_cards_page(
+                session, deck_id, last_id=last_id, limit=self._PAGE_SIZE
+            )
+        self.after(0, self._append_page, deck_id, page)
+
+    def _append_page(self, deck_id: int, page: list) -> None:
+        self._fetching = False
+        if deck_id != self._deck_id:
+            return
+        self._all_loaded = len(page) < self._PAGE_SIZE
+        if page:
+            self._cards_data.extend(page)
+            self._canvas.configure(
+                scrollregion=(0, 0, 0, len(self._cards_data) * self._ROW_HEIGHT)
+            )
+            self._update_visible_rows()
+
+    def _on_canvas_resize(self, event) -> None:
+        # Grow the pool to cover the viewport — very tall windows need
+        # more live rows than the initial allotment.
+        needed = event.height // self._ROW_HEIGHT + 2
+        while len(self._row_pool) < needed:
+            self._add_pool_row()
+        self._canvas_width = event.width
+        for item, _ in self._row_pool:
+            self._canvas.itemconfigure(item, width=event.width)
+        self._update_visible_rows()
+
+    def _on_mousewheel(self, event) -> None:
+        if getattr(event, "num", None) == 4:
+            step = -1
+        elif getattr(event, "num", None) == 5:
+            step = 1
+        else:
+            step = -int(event.delta / 120)
+        self._canvas.yview_scroll(step, "units")
 
     def clear(self) -> None:
-        for w in self.winfo_children():
+        self._deck_id = None
+        self._cards_data = []
+        self._slot_index = [-1] * len(self._row_pool)
+        for item, _ in self._row_pool:
+            self._canvas.itemconfigure(item, state="hidden")
+        for w in self._header_area.winfo_children():
             w.destroy()
-        self._placeholder = ctk.CTkLabel(
-            self,
-            text="← Select a deck from the sidebar to view its cards",
-            font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=15),
-            text_color=Theme.TEXT_MUTED,
-        )
+        self._header_area.pack_forget()
+        self._empty_lbl.pack_forget()
+        self._list_wrap.pack_forget()
         self._placeholder.pack(expand=True)
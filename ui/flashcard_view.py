@@ -8,13 +8,13 @@ buttons, and a real-time progress bar.
 from __future__ import annotations
 
 import random
-from typing import Callable, List
+from typing import Callable
 
 import customtkinter as ctk
 
 from db.database import get_session
 from db.models import Card
-from core.srs_engine import get_due_cards, record_review
+from core.srs_engine import get_due_card_rows, record_review
 from ui.widgets import Theme, AccentButton, GhostButton, Separator
 
 
@@ -40,7 +40,16 @@ class FlashcardView(ctk.CTkFrame):
         super().__init__(master, **kw)
 
         self._on_finish = on_finish
-        self._cards: List[Card] = []
+        self._session = None      # one session for the whole review
+        self._cards: list = []   # plain (id, front, back, …) rows
+
+        # Long-lived frames — built lazily on first use and then swapped
+        # with pack/pack_forget; widget creation is the dominant cost of
+        # every CTk screen transition.
+        self._study_wrap: ctk.CTkFrame | None = None
+        self._summary_frame: ctk.CTkFrame | None = None
+        self._empty_frame: ctk.CTkFrame | None = None
+        self._progress_pending = False
         self._index = 0
         self._flipped = False
         self._correct = 0
@@ -52,17 +61,28 @@ class FlashcardView(ctk.CTkFrame):
 
     def start_session(self, deck_id: int) -> None:
         """Load due cards and begin the review loop."""
-        session = get_session()
-        try:
-            self._cards = get_due_cards(session, deck_id)
-        finally:
-            session.close()
+        # One session for the whole review: ratings reuse its connection
+        # instead of paying checkout + teardown per card.  It is closed
+        # in _exit_session.
+        self._close_session()
+        self._session = get_session()
+        # Column rows instead of Card instances: the view only reads six
+        # fields, and plain tuples skip per-row ORM instrumentation.
+        self._cards = get_due_card_rows(self._session, deck_id)
 
         if not self._cards:
             self._show_empty()
             return
 
         random.shuffle(self._cards)
+        # Rows are immutable for the session — format every display
+        # string once here so show/flip is a plain list index.
+        self._fronts = [
+            f"{r.article} {r.front}" if r.article else r.front for r in self._cards
+        ]
+        self._backs = [r.back or "—" for r in self._cards]
+        self._details = [r.word_type or "" for r in self._cards]
+        self._examples = [r.example_sentence or "" for r in self._cards]
         self._index = 0
         self._flipped = False
         self._correct = 0
@@ -75,11 +95,23 @@ class FlashcardView(ctk.CTkFrame):
     # ------------------------------------------------------------------
 
     def _build_ui(self) -> None:
-        for w in self.winfo_children():
-            w.destroy()
+        if self._summary_frame is not None:
+            self._summary_frame.pack_forget()
+        if self._empty_frame is not None:
+            self._empty_frame.pack_forget()
+        if self._study_wrap is not None:
+            # Already built — just reset and re-show
+            self._progress_bar.set(0)
+            self._progress_label.configure(text="")
+            self._study_wrap.pack(fill="both", expand=True)
+            return
+
+        self._study_wrap = ctk.CTkFrame(self, fg_color="transparent")
+        self._study_wrap.pack(fill="both", expand=True)
+        wrap = self._study_wrap
 
         # ── Top bar ──
-        top = ctk.CTkFrame(self, fg_color="transparent")
+        top = ctk.CTkFrame(wrap, fg_color="transparent")
         top.pack(fill="x", padx=28, pady=(20, 0))
 
         GhostButton(top, text="✕  Exit", command=self._exit_session).pack(side="left")
@@ -93,7 +125,7 @@ class FlashcardView(ctk.CTkFrame):
 
         # Progress bar
         self._progress_bar = ctk.CTkProgressBar(
-            self, fg_color=Theme.BG_CARD, progress_color=Theme.ACCENT,
+            wrap, fg_color=Theme.BG_CARD, progress_color=Theme.ACCENT,
             corner_radius=6, height=6,
         )
         self._progress_bar.pack(fill="x", padx=28, pady=(12, 0))
@@ -101,7 +133,7 @@ class FlashcardView(ctk.CTkFrame):
 
         # ── Card area ──
         self._card_frame = ctk.CTkFrame(
-            self, fg_color=Theme.BG_CARD, corner_radius=20,
+            wrap, fg_color=Theme.BG_CARD, corner_radius=20,
             border_width=1, border_color=Theme.BORDER,
         )
         self._card_frame.pack(padx=60, pady=(30, 16), fill="both", expand=True)
@@ -134,7 +166,7 @@ class FlashcardView(ctk.CTkFrame):
         self._hint_label.bind("<Button-1>", lambda _: self._flip())
 
         # ── Rating buttons ──
-        self._rating_frame = ctk.CTkFrame(self, fg_color="transparent")
+        self._rating_frame = ctk.CTkFrame(wrap, fg_color="transparent")
         self._rating_frame.pack(fill="x", padx=60, pady=(0, 28))
 
         for qi, (label, color) in enumerate(self.QUALITY_LABELS, start=1):
@@ -160,10 +192,8 @@ class FlashcardView(ctk.CTkFrame):
     # ------------------------------------------------------------------
 
     def _show_card(self) -> None:
-        card = self._cards[self._index]
-        front = f"{card.article} {card.front}" if card.article else card.front
-        self._word_label.configure(text=front)
-        self._detail_label.configure(text=card.word_type or "")
+        self._word_label.configure(text=self._fronts[self._index])
+        self._detail_label.configure(text=self._details[self._index])
         self._hint_label.configure(text="Click to reveal")
         self._flipped = False
         self._hide_rating()
@@ -173,12 +203,8 @@ class FlashcardView(ctk.CTkFrame):
         if self._flipped:
             return
         self._flipped = True
-        card = self._cards[self._index]
-        back = card.back if card.back else "—"
-        self._word_label.configure(text=back)
-        self._detail_label.configure(
-            text=card.example_sentence or "",
-        )
+        self._word_label.configure(text=self._backs[self._index])
+        self._detail_label.configure(text=self._examples[self._index])
         self._hint_label.configure(text="Rate your recall ↓")
         self._show_rating()
 
@@ -187,13 +213,12 @@ class FlashcardView(ctk.CTkFrame):
     # ------------------------------------------------------------------
 
     def _rate(self, quality: int) -> None:
-        card = self._cards[self._index]
-        session = get_session()
-        try:
-            merged = session.merge(card)
-            record_review(session, merged, quality)
-        finally:
-            session.close()
+        row = self._cards[self._index]
+        # Load just this card for writing; the display rows stay plain
+        # tuples.  record_review commits on the long-lived session.
+        card = self._session.get(Card, row.id)
+        if card is not None:
+            record_review(self._session, card, quality)
 
         if quality >= 3:
             self._correct += 1
@@ -217,48 +242,84 @@ class FlashcardView(ctk.CTkFrame):
         self._rating_frame.pack_forget()
 
     def _update_progress(self) -> None:
+        # Debounced: rapid rating clicks coalesce into one bar redraw —
+        # CTkProgressBar.set() forces a canvas redraw, which is the
+        # slowest part of advancing a card.
+        if self._progress_pending:
+            return
+        self._progress_pending = True
+        self.after(50, self._flush_progress)
+
+    def _flush_progress(self) -> None:
+        self._progress_pending = False
+        if self._study_wrap is None:
+            return
         total = len(self._cards)
         done = self._index
         self._progress_bar.set(done / total if total else 0)
         self._progress_label.configure(text=f"{done} / {total}")
 
     def _show_summary(self) -> None:
-        for w in self.winfo_children():
-            w.destroy()
+        if self._study_wrap is not None:
+            self._study_wrap.pack_forget()
 
         total = self._correct + self._incorrect
         pct = round(self._correct / total * 100) if total else 0
+        stats = (
+            f"✅ {self._correct}  correct    "
+            f"❌ {self._incorrect}  incorrect    📊 {pct}%"
+        )
 
-        wrap = ctk.CTkFrame(self, fg_color="transparent")
-        wrap.pack(expand=True)
-
-        ctk.CTkLabel(
-            wrap, text="🎉  Session Complete!",
-            font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=28, weight="bold"),
-            text_color=Theme.SUCCESS,
-        ).pack(pady=(0, 16))
-
-        ctk.CTkLabel(
-            wrap,
-            text=f"✅ {self._correct}  correct    ❌ {self._incorrect}  incorrect    📊 {pct}%",
-            font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=16),
-            text_color=Theme.TEXT_PRIMARY,
-        ).pack(pady=(0, 28))
-
-        AccentButton(wrap, text="Done", command=self._exit_session, width=140).pack()
+        if self._summary_frame is None:
+            self._summary_frame = ctk.CTkFrame(self, fg_color="transparent")
+            ctk.CTkLabel(
+                self._summary_frame, text="🎉  Session Complete!",
+                font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=28, weight="bold"),
+                text_color=Theme.SUCCESS,
+            ).pack(pady=(0, 16))
+            self._summary_stats = ctk.CTkLabel(
+                self._summary_frame, text=stats,
+                font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=16),
+                text_color=Theme.TEXT_PRIMARY,
+            )
+            self._summary_stats.pack(pady=(0, 28))
+            AccentButton(
+                self._summary_frame, text="Done",
+                command=self._exit_session, width=140,
+            ).pack()
+        else:
+            self._summary_stats.configure(text=stats)
+        self._summary_frame.pack(expand=True)
 
     def _show_empty(self) -> None:
-        for w in self.winfo_children():
-            w.destroy()
-        ctk.CTkLabel(
-            self, text="✅  No cards due — you're all caught up!",
-            font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=18),
-            text_color=Theme.SUCCESS,
-        ).pack(expand=True)
-        GhostButton(self, text="← Back", command=self._exit_session).pack(pady=16)
+        if self._study_wrap is not None:
+            self._study_wrap.pack_forget()
+        if self._summary_frame is not None:
+            self._summary_frame.pack_forget()
+        if self._empty_frame is None:
+            self._empty_frame = ctk.CTkFrame(self, fg_color="transparent")
+            ctk.CTkLabel(
+                self._empty_frame,
+                text="✅  No cards due — you're all caught up!",
+                font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=18),
+                text_color=Theme.SUCCESS,
+            ).pack(expand=True)
+            GhostButton(
+                self._empty_frame, text="← Back", command=self._exit_session,
+            ).pack(pady=16)
+        self._empty_frame.pack(expand=True)
+
+    def _close_session(self) -> None:
+        if self._session is not None:
+            self._session.close()
+            self._session = None
 
     def _exit_session(self) -> None:
+        self._close_session()
         for w in self.winfo_children():
             w.destroy()
+        self._study_wrap = None
+        self._summary_frame = None
+        self._empty_frame = None
         if self._on_finish:
             self._on_finish()
@@ -11,16 +11,20 @@ Supports TWO document modes:
 
 from __future__ import annotations
 
+import re
 import threading
+import tkinter as tk
 from pathlib import Path
 from tkinter import filedialog
 from typing import Callable, List
 
 import customtkinter as ctk
 
-from db.database import get_session
+from sqlalchemy.orm import Session
+
+from db.database import engine
 from db.models import Folder, Deck, Card
-from core.extractor import extract_text, is_structured, parse_structured_vocab
+from core.extractor import extract_text_stream, is_structured, parse_structured_vocab
 from core.nlp_processor import extract_vocabulary, VocabEntry
 from ui.widgets import Theme, AccentButton, DangerButton, GhostButton, Separator
 
@@ -31,6 +35,11 @@ class ImportDialog(ctk.CTkToplevel):
     WIDTH = 860
     HEIGHT = 660
 
+    # Preview table virtualization: the canvas scrollregion covers every
+    # entry, but only this many pooled row widgets ever exist.
+    _PREVIEW_ROW_H = 32
+    _PREVIEW_POOL = 24
+
     def __init__(
         self,
         master,
@@ -49,6 +58,18 @@ class ImportDialog(ctk.CTkToplevel):
         self._folder_id = folder_id
         self._on_complete = on_complete
 
+        # Shared fonts — each CTkFont is a Tk-side resource; build one
+        # per variant instead of one per label.
+        self._font_title = ctk.CTkFont(family=Theme.FONT_FAMILY, size=22, weight="bold")
+        self._font_subtitle = ctk.CTkFont(family=Theme.FONT_FAMILY, size=20, weight="bold")
+        self._font_heading = ctk.CTkFont(family=Theme.FONT_FAMILY, size=18, weight="bold")
+        self._font_body = ctk.CTkFont(family=Theme.FONT_FAMILY, size=14)
+        self._font_small = ctk.CTkFont(family=Theme.FONT_FAMILY, size=13)
+        self._font_small_bold = ctk.CTkFont(family=Theme.FONT_FAMILY, size=13, weight="bold")
+        self._font_row = ctk.CTkFont(family=Theme.FONT_FAMILY, size=12)
+        self._font_col = ctk.CTkFont(family=Theme.FONT_FAMILY, size=11, weight="bold")
+        self._font_mono = ctk.CTkFont(family="Consolas", size=12)
+
         # Results — one of these will be populated
         self._vocab: List[VocabEntry] = []
         self._pairs: List[tuple[str, str]] = []
@@ -56,21 +77,54 @@ class ImportDialog(ctk.CTkToplevel):
 
         self._filepath: str | None = None
 
+        # Step containers — each is built once on first visit and then
+        # swapped in with pack/pack_forget.  Destroying and rebuilding a
+        # step's widgets was the bulk of every transition's cost.
+        self._steps: dict[str, ctk.CTkFrame] = {}
+        self._current_step: str | None = None
+
         self._build_step_pick()
 
+    def _show_step(self, name: str) -> ctk.CTkFrame:
+        """Make *name*'s container the visible step and return it.
+
+        Frames are created empty on first use; callers populate them once
+        and afterwards only update the dynamic labels inside.
+        """
+        frame = self._steps.get(name)
+        if frame is None:
+            frame = ctk.CTkFrame(self, fg_color="transparent")
+            self._steps[name] = frame
+        if self._current_step != name:
+            # Stop indeterminate bars on the step we are leaving so their
+            # animation timers don't keep firing while hidden.
+            if self._current_step == "proc":
+                self._pbar.stop()
+            elif self._current_step == "saving":
+                self._save_pbar.stop()
+            current = self._steps.get(self._current_step)
+            if current is not None:
+                current.pack_forget()
+            if name == "preview":
+                frame.pack(fill="both", expand=True)
+            else:
+                frame.pack(expand=True)
+            self._current_step = name
+        return frame
+
     # ==================================================================
     # Step 1 – Pick file
     # ==================================================================
 
     def _build_step_pick(self) -> None:
-        self._clear()
-
-        wrap = ctk.CTkFrame(self, fg_color="transparent")
-        wrap.pack(expand=True)
+        built = "pick" in self._steps
+        wrap = self._show_step("pick")
+        if built:
+            return
 
         ctk.CTkLabel(
             wrap, text="📥  Import a file",
-            font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=22, weight="bold"),
+            font=self._font_title,
             text_color=Theme.TEXT_PRIMARY,
         ).pack(pady=(0, 8))
 
@@ -79,7 +133,7 @@ class ImportDialog(ctk.CTkToplevel):
             text="Select a PDF or TXT file.\n"
                  "Structured files (front ; back) are imported directly.\n"
                  "Free-text files are analysed to extract vocabulary.",
-            font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=14),
+            font=self._font_body,
             text_color=Theme.TEXT_SECONDARY,
             justify="center",
         ).pack(pady=(0, 12))
@@ -91,7 +145,7 @@ class ImportDialog(ctk.CTkToplevel):
         ctk.CTkLabel(
             hint_frame,
             text="📋  Supported structured formats:",
-            font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=13, weight="bold"),
+            font=self._font_small_bold,
             text_color=Theme.ACCENT,
         ).pack(anchor="w", padx=16, pady=(12, 4))
 
@@ -104,7 +158,7 @@ class ImportDialog(ctk.CTkToplevel):
         ctk.CTkLabel(
             hint_frame,
             text=examples,
-            font=ctk.CTkFont(family="Consolas", size=12),
+            font=self._font_mono,
             text_color=Theme.TEXT_SECONDARY,
             justify="left",
         ).pack(anchor="w", padx=24, pady=(0, 12))
@@ -132,48 +186,62 @@ class ImportDialog(ctk.CTkToplevel):
     # ==================================================================
 
     def _build_step_processing(self) -> None:
-        self._clear()
-
-        wrap = ctk.CTkFrame(self, fg_color="transparent")
-        wrap.pack(expand=True)
-
-        ctk.CTkLabel(
-            wrap, text="⏳  Processing…",
-            font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=20, weight="bold"),
-            text_color=Theme.ACCENT,
-        ).pack(pady=(0, 12))
+        built = "proc" in self._steps
+        wrap = self._show_step("proc")
+        if not built:
+            ctk.CTkLabel(
+                wrap, text="⏳  Processing…",
+                font=self._font_subtitle,
+                text_color=Theme.ACCENT,
+            ).pack(pady=(0, 12))
+
+            self._status_label = ctk.CTkLabel(
+                wrap, text="",
+                font=self._font_small,
+                text_color=Theme.TEXT_SECONDARY,
+            )
+            self._status_label.pack()
 
-        self._status_label = ctk.CTkLabel(
-            wrap, text=f"Reading {Path(self._filepath).name}",
-            font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=13),
-            text_color=Theme.TEXT_SECONDARY,
-        )
-        self._status_label.pack()
+            self._pbar = ctk.CTkProgressBar(
+                wrap, fg_color=Theme.BG_CARD, progress_color=Theme.ACCENT,
+                width=400, height=8, corner_radius=4,
+                mode="indeterminate",
+            )
+            self._pbar.pack(pady=(16, 0))
 
-        self._pbar = ctk.CTkProgressBar(
-            wrap, fg_color=Theme.BG_CARD, progress_color=Theme.ACCENT,
-            width=400, height=8, corner_radius=4,
-            mode="indeterminate",
-        )
-        self._pbar.pack(pady=(16, 0))
+        self._status_label.configure(text=f"Reading {Path(self._filepath).name}")
         self._pbar.start()
 
         threading.Thread(target=self._run_pipeline, daemon=True).start()
 
     def _run_pipeline(self) -> None:
         try:
-            text = extract_text(self._filepath)
-
-            if is_structured(text):
-                self.after(0, lambda: self._status_label.configure(
-                    text="Structured format detected — parsing pairs…"
-                ))
+            # Stream the extraction so format detection can run as soon
+            # as enough lines have arrived — for a multi-page PDF the
+            # status line updates while later pages are still being
+            # pulled, instead of after the whole document lands.
+            chunks: list[str] = []
+            lines_seen = 0
+            detected: bool | None = None
+            for chunk in extract_text_stream(self._filepath):
+                chunks.append(chunk)
+                if detected is None:
+                    lines_seen += sum(1 for ln in chunk.splitlines() if ln.strip())
+                    if lines_seen >= 40:
+                        detected = is_structured("\n".join(chunks))
+                self.after(0, self._set_detect_status, detected, len(chunks))
+
+            text = "\n".join(chunks)
+            if detected is None:   # short document — decide on the whole text
+                detected = is_structured(text)
+            self.after(0, self._set_detect_status, detected, len(chunks))
+
+            if detected:
+                self.after(0, self._set_phase_status, "Parsing vocabulary pairs…")
                 self._pairs = parse_structured_vocab(text)
                 self._is_structured = True
             else:
-                self.after(0, lambda: self._status_label.configure(
-                    text="Free text detected — running NLP analysis…"
-                ))
+                self.after(0, self._set_phase_status, "Running NLP analysis…")
                 self._vocab = extract_vocabulary(text)
                 self._is_structured = False
 
@@ -181,118 +249,272 @@ class ImportDialog(ctk.CTkToplevel):
         except Exception as exc:
             self.after(0, lambda: self._show_error(str(exc)))
 
+    def _set_detect_status(self, structured: bool | None, pages: int) -> None:
+        """Refresh the status line after each extracted page.
+
+        *structured* is None while format detection is still gathering
+        lines; once decided the verdict replaces the page counter.
+        """
+        if structured is None:
+            text = f"Extracting text… (page {pages})"
+        elif structured:
+            text = f"Structured format detected — extracting page {pages}…"
+        else:
+            text = f"Free text detected — extracting page {pages}…"
+        self._status_label.configure(text=text)
+
+    def _set_phase_status(self, text: str) -> None:
+        self._status_label.configure(text=text)
+
     # ==================================================================
     # Step 3 – Preview
     # ==================================================================
 
     def _build_step_preview(self) -> None:
-        self._clear()
+        built = "preview" in self._steps
+        wrap = self._show_step("preview")
 
-        count = len(self._pairs) if self._is_structured else len(self._vocab)
-        mode_label = "structured pairs" if self._is_structured else "vocabulary items"
+        if not built:
+            hdr = ctk.CTkFrame(wrap, fg_color="transparent")
+            hdr.pack(fill="x", padx=24, pady=(20, 0))
 
-        # Header
-        hdr = ctk.CTkFrame(self, fg_color="transparent")
-        hdr.pack(fill="x", padx=24, pady=(20, 0))
+            self._preview_count_lbl = ctk.CTkLabel(
+                hdr, text="",
+                font=self._font_heading,
+                text_color=Theme.TEXT_PRIMARY,
+            )
+            self._preview_count_lbl.pack(side="left")
+
+            AccentButton(
+                hdr, text="✔  Import All",
+                command=self._confirm_import, width=140,
+            ).pack(side="right", padx=(8, 0))
+            DangerButton(
+                hdr, text="Cancel",
+                command=self.destroy, width=90,
+            ).pack(side="right")
+
+            self._preview_badge = ctk.CTkLabel(
+                hdr, text="",
+                font=self._font_col,
+                corner_radius=6,
+                text_color="#ffffff",
+            )
+            self._preview_badge.pack(side="left", padx=(12, 0))
 
-        ctk.CTkLabel(
-            hdr,
-            text=f"Found {count} {mode_label}",
-            font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=18, weight="bold"),
-            text_color=Theme.TEXT_PRIMARY,
-        ).pack(side="left")
-
-        AccentButton(
-            hdr, text="✔  Import All",
-            command=self._confirm_import, width=140,
-        ).pack(side="right", padx=(8, 0))
-        DangerButton(
-            hdr, text="Cancel",
-            command=self.destroy, width=90,
-        ).pack(side="right")
-
-        # Mode badge
-        badge = ctk.CTkLabel(
-            hdr,
-            text=f"  {'📋 Structured' if self._is_structured else '🧠 NLP'}  ",
-            font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=11, weight="bold"),
-            fg_color=Theme.ACCENT if self._is_structured else Theme.WARNING,
-            corner_radius=6,
-            text_color="#ffffff",
-        )
-        badge.pack(side="left", padx=(12, 0))
+            Separator(wrap).pack(fill="x", padx=24, pady=(12, 0))
 
-        Separator(self).pack(fill="x", padx=24, pady=(12, 0))
+            # Everything below the separator is rebuilt only when the
+            # column layout changes (structured vs NLP preview).
+            self._preview_wrap = ctk.CTkFrame(wrap, fg_color="transparent")
+            self._preview_wrap.pack(fill="both", expand=True, padx=20, pady=8)
+            self._preview_cols: list[tuple[str, int]] | None = None
+            self._preview_pool: list[tuple[int, list[ctk.CTkLabel]]] = []
 
-        # Table
-        scroll = ctk.CTkScrollableFrame(
-            self, fg_color="transparent",
-            scrollbar_button_color=Theme.BORDER,
-            scrollbar_button_hover_color=Theme.ACCENT,
+        count = len(self._pairs) if self._is_structured else len(self._vocab)
+        mode_label = "structured pairs" if self._is_structured else "vocabulary items"
+        self._preview_count_lbl.configure(text=f"Found {count} {mode_label}")
+        self._preview_badge.configure(
+            text=f"  {'📋 Structured' if self._is_structured else '🧠 NLP'}  ",
+            fg_color=Theme.ACCENT if self._is_structured else Theme.WARNING,
         )
-        scroll.pack(fill="both", expand=True, padx=20, pady=8)
 
+        # Table — virtualized: text tuples are precomputed once, and a
+        # small pool of row widgets is recycled over them on scroll.
         if self._is_structured:
-            self._preview_structured(scroll)
+            cols = [("Front (Deutsch)", 350), ("Back (Translation)", 350)]
+            rows = self._pairs
         else:
-            self._preview_nlp(scroll)
+            cols = [("Word", 220), ("Type", 70), ("Article", 60), ("Example", 360)]
+            rows = [
+                (
+                    entry.display_front(),
+                    entry.word_type,
+                    entry.article or "—",
+                    (entry.example_sentence[:80] + "…")
+                    if len(entry.example_sentence) > 80
+                    else (entry.example_sentence or "—"),
+                )
+                for entry in self._vocab
+            ]
+        self._build_preview_table(cols, rows)
+        # One explicit idle-pass after the whole step is assembled; no
+        # update() anywhere, so Tk coalesces all pending geometry work
+        # into this single recomputation.
+        self.update_idletasks()
+
+    def _build_preview_table(
+        self, cols: list[tuple[str, int]], rows: list[tuple]
+    ) -> None:
+        self._preview_rows = rows
+
+        need_pool = min(self._PREVIEW_POOL, len(rows))
+        if cols == self._preview_cols and len(self._preview_pool) >= need_pool:
+            # Same column layout — retarget the existing pool at the new
+            # rows instead of rebuilding canvas and widgets.
+            self._preview_slots = [-1] * len(self._preview_pool)
+            self._preview_canvas.configure(
+                scrollregion=(0, 0, 0, len(rows) * self._PREVIEW_ROW_H)
+            )
+            self._preview_canvas.yview_moveto(0)
+            self._update_preview_rows()
+            return
 
-    def _preview_structured(self, parent) -> None:
-        """Table: Front | Back"""
-        hdr = ctk.CTkFrame(parent, fg_color=Theme.BG_CARD, corner_radius=8)
+        self._preview_cols = cols
+        for w in self._preview_wrap.winfo_children():
+            w.destroy()
+        wrap = self._preview_wrap
+
+        hdr = ctk.CTkFrame(wrap, fg_color=Theme.BG_CARD, corner_radius=8)
         hdr.pack(fill="x", pady=(0, 6))
-        for col, w in [("Front (Deutsch)", 350), ("Back (Translation)", 350)]:
+        for col, w in cols:
             ctk.CTkLabel(
                 hdr, text=col, width=w,
-                font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=11, weight="bold"),
+                font=self._font_col,
                 text_color=Theme.TEXT_MUTED,
             ).pack(side="left", padx=8, pady=6)
 
-        for front, back in self._pairs:
-            row = ctk.CTkFrame(parent, fg_color=Theme.BG_CARD, corner_radius=8)
-            row.pack(fill="x", pady=1)
-            for text, w in [(front, 350), (back, 350)]:
-                ctk.CTkLabel(
-                    row, text=text, width=w,
-                    font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=13),
+        self._preview_canvas = tk.Canvas(
+            wrap, bg=Theme.BG_DARK, highlightthickness=0, bd=0
+        )
+        sb = ctk.CTkScrollbar(
+            wrap, command=self._preview_canvas.yview,
+            button_color=Theme.BORDER, button_hover_color=Theme.ACCENT,
+        )
+        sb.pack(side="right", fill="y")
+        self._preview_canvas.pack(side="left", fill="both", expand=True)
+        self._preview_canvas.configure(
+            yscrollcommand=lambda a, b: (sb.set(a, b), self._update_preview_rows()),
+            scrollregion=(0, 0, 0, len(rows) * self._PREVIEW_ROW_H),
+        )
+        self._preview_canvas.bind(
+            "<Configure>", lambda e: self._resize_preview_rows(e.width)
+        )
+        for seq in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self._preview_canvas.bind(seq, self._on_preview_wheel)
+
+        self._preview_pool: list[tuple[int, list[ctk.CTkLabel]]] = []
+        self._preview_slots: list[int] = []
+        for _ in range(min(self._PREVIEW_POOL, len(rows))):
+            frame = ctk.CTkFrame(
+                self._preview_canvas, fg_color=Theme.BG_CARD,
+                corner_radius=8, height=28,
+            )
+            labels: list[ctk.CTkLabel] = []
+            for _, w in cols:
+                lbl = ctk.CTkLabel(
+                    frame, text="", width=w, font=self._font_row,
                     text_color=Theme.TEXT_PRIMARY, anchor="w",
-                ).pack(side="left", padx=8, pady=5)
+                )
+                lbl.pack(side="left", padx=8, pady=4)
+                labels.append(lbl)
+            for widget in (frame, *labels):
+                for seq in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+                    widget.bind(seq, self._on_preview_wheel)
+            item = self._preview_canvas.create_window(
+                0, 0, window=frame, anchor="nw", height=28
+            )
+            self._preview_pool.append((item, labels))
+            self._preview_slots.append(-1)
+        self._update_preview_rows()
 
-    def _preview_nlp(self, parent) -> None:
-        """Table: Word | Type | Article | Example"""
-        hdr = ctk.CTkFrame(parent, fg_color=Theme.BG_CARD, corner_radius=8)
-        hdr.pack(fill="x", pady=(0, 6))
-        for col, w in [("Word", 220), ("Type", 70), ("Article", 60), ("Example", 360)]:
-            ctk.CTkLabel(
-                hdr, text=col, width=w,
-                font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=11, weight="bold"),
-                text_color=Theme.TEXT_MUTED,
-            ).pack(side="left", padx=6, pady=6)
-
-        for entry in self._vocab:
-            row = ctk.CTkFrame(parent, fg_color=Theme.BG_CARD, corner_radius=8)
-            row.pack(fill="x", pady=1)
-            example = entry.example_sentence
-            if len(example) > 80:
-                example = example[:80] + "…"
-            for text, w in [
-                (entry.display_front(), 220),
-                (entry.word_type, 70),
-                (entry.article or "—", 60),
-                (example or "—", 360),
-            ]:
-                ctk.CTkLabel(
-                    row, text=text, width=w,
-                    font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=12),
-                    text_color=Theme.TEXT_PRIMARY, anchor="w",
-                ).pack(side="left", padx=6, pady=5)
+    def _update_preview_rows(self) -> None:
+        canvas = self._preview_canvas
+        if not self._preview_pool:
+            return
+        first = int(canvas.canvasy(0) // self._PREVIEW_ROW_H)
+        first = max(
+            0,
+            min(first, max(0, len(self._preview_rows) - len(self._preview_pool))),
+        )
+        for slot, (item, labels) in enumerate(self._preview_pool):
+            idx = first + slot
+            if idx >= len(self._preview_rows):
+                canvas.itemconfigure(item, state="hidden")
+                self._preview_slots[slot] = -1
+                continue
+            canvas.coords(item, 0, idx * self._PREVIEW_ROW_H)
+            if self._preview_slots[slot] == idx:
+                continue
+            self._preview_slots[slot] = idx
+            canvas.itemconfigure(item, state="normal")
+            for lbl, value in zip(labels, self._preview_rows[idx]):
+                # Columns repeat heavily ("—", empty article, same word
+                # type) — skip the configure() redraw when the text is
+                # already right.
+                if getattr(lbl, "_last_text", None) != value:
+                    lbl.configure(text=value)
+                    lbl._last_text = value
+
+    def _resize_preview_rows(self, width: int) -> None:
+        for item, _ in self._preview_pool:
+            self._preview_canvas.itemconfigure(item, width=width)
+        self._update_preview_rows()
+
+    def _on_preview_wheel(self, event) -> None:
+        if getattr(event, "num", None) == 4:
+            step = -1
+        elif getattr(event, "num", None) == 5:
+            step = 1
+        else:
+            step = -int(event.delta / 120)
+        self._preview_canvas.yview_scroll(step, "units")
 
     # ==================================================================
     # Step 4 – Confirm & create cards
     # ==================================================================
 
     def _confirm_import(self) -> None:
-        session = get_session()
+        """Kick the insert work onto a thread so the dialog keeps painting."""
+        self._build_step_saving()
+        threading.Thread(target=self._do_import, daemon=True).start()
+
+    def _build_step_saving(self) -> None:
+        built = "saving" in self._steps
+        wrap = self._show_step("saving")
+        if not built:
+            ctk.CTkLabel(
+                wrap, text="💾  Saving…",
+                font=self._font_subtitle,
+                text_color=Theme.ACCENT,
+            ).pack(pady=(0, 12))
+            self._save_pbar = ctk.CTkProgressBar(
+                wrap, fg_color=Theme.BG_CARD, progress_color=Theme.ACCENT,
+                width=400, height=8, corner_radius=4,
+                mode="indeterminate",
+            )
+            self._save_pbar.pack(pady=(16, 0))
+        self._save_pbar.start()
+
+    def _do_import(self) -> None:
+        try:
+            self._insert_cards()
+        except Exception as exc:
+            self.after(0, lambda exc=exc: self._show_error(str(exc)))
+            return
+        self.after(0, self._finish_import)
+
+    def _insert_cards(self) -> None:
+        # Pin ONE connection for the whole import: the PRAGMA below is
+        # per-connection state, and a pool-managed session releases its
+        # connection on commit — the restore could then land on a
+        # different checkout and leave a pooled connection at OFF.
+        with engine.connect() as conn:
+            try:
+                # Drop fsyncs for the duration of the bulk insert.  The
+                # whole import is one transaction anyway — if the process
+                # dies mid-import the deck is simply absent, so there is
+                # nothing durability buys here.  journal_mode stays
+                # untouched (WAL is persistent in the file); NORMAL is
+                # restored in finally on this same connection.
+                conn.exec_driver_sql("PRAGMA synchronous=OFF")
+                conn.commit()  # end the autobegun txn; the session owns its own
+                self._insert_cards_on(Session(bind=conn))
+            finally:
+                conn.exec_driver_sql("PRAGMA synchronous=NORMAL")
+                conn.commit()
+
+    def _insert_cards_on(self, session: Session) -> None:
         try:
             folder_id = self._folder_id
             if folder_id is None:
@@ -310,21 +532,23 @@ class ImportDialog(ctk.CTkToplevel):
             session.add(deck)
             session.flush()
 
+            # Plain dicts + bulk_insert_mappings: skips per-instance
+            # unit-of-work tracking, one multi-row INSERT per batch.
             if self._is_structured:
+                rows = []
                 for front, back in self._pairs:
                     # Try to extract article from front (e.g. "das Haus" → article="das", front="Haus")
                     article, clean_front = _split_article(front)
-                    card = Card(
+                    rows.append(dict(
                         deck_id=deck.id,
                         front=clean_front,
                         back=back,
                         article=article,
                         word_type="NOUN" if article else "",
-                    )
-                    session.add(card)
+                    ))
             else:
-                for entry in self._vocab:
-                    card = Card(
+                rows = [
+                    dict(
                         deck_id=deck.id,
                         front=entry.word,
                         back=entry.lemma if entry.lemma != entry.word else "",
@@ -332,12 +556,19 @@ class ImportDialog(ctk.CTkToplevel):
                         word_type=entry.word_type,
                         example_sentence=entry.example_sentence,
                     )
-                    session.add(card)
+                    for entry in self._vocab
+                ]
 
+            if rows:
+                session.bulk_insert_mappings(Card, rows)
             session.commit()
         finally:
-            session.close()
+            try:
+                session.rollback()
+            finally:
+                session.close()
 
+    def _finish_import(self) -> None:
         if self._on_complete:
             self._on_complete()
         self.destroy()
@@ -347,36 +578,36 @@ class ImportDialog(ctk.CTkToplevel):
     # ==================================================================
 
     def _show_error(self, msg: str) -> None:
-        self._clear()
-        wrap = ctk.CTkFrame(self, fg_color="transparent")
-        wrap.pack(expand=True)
-        ctk.CTkLabel(
-            wrap, text="❌  Error",
-            font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=20, weight="bold"),
-            text_color=Theme.DANGER,
-        ).pack(pady=(0, 8))
-        ctk.CTkLabel(
-            wrap, text=msg, wraplength=600,
-            font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=13),
-            text_color=Theme.TEXT_SECONDARY,
-        ).pack(pady=(0, 20))
-        GhostButton(wrap, text="← Try again", command=self._build_step_pick).pack()
-
-    def _clear(self) -> None:
-        for w in self.winfo_children():
-            w.destroy()
+        built = "error" in self._steps
+        wrap = self._show_step("error")
+        if not built:
+            ctk.CTkLabel(
+                wrap, text="❌  Error",
+                font=self._font_subtitle,
+                text_color=Theme.DANGER,
+            ).pack(pady=(0, 8))
+            self._error_lbl = ctk.CTkLabel(
+                wrap, text="", wraplength=600,
+                font=self._font_small,
+                text_color=Theme.TEXT_SECONDARY,
+            )
+            self._error_lbl.pack(pady=(0, 20))
+            GhostButton(wrap, text="← Try again", command=self._build_step_pick).pack()
+        self._error_lbl.configure(text=msg)
 
 
 # ──────────────────────────────────────────────────────────────────────
 # Utility
 # ──────────────────────────────────────────────────────────────────────
 
-_ARTICLES = {"der", "die", "das", "ein", "eine"}
+# One compiled pattern does the split, the article membership test, and
+# multi-space handling in a single C-level match per imported line.
+_ARTICLE_RE = re.compile(r"^(der|die|das|ein|eine)\s+(\S.*)$", re.IGNORECASE)
 
 
 def _split_article(text: str) -> tuple[str | None, str]:
     """Split ``'das Haus'`` → ``('das', 'Haus')``."""
-    parts = text.split(None, 1)
-    if len(parts) == 2 and parts[0].lower() in _ARTICLES:
-        return parts[0].lower(), parts[1]
+    m = _ARTICLE_RE.match(text)
+    if m:
+        return m.group(1).lower(), m.group(2)
     return None, text
@@ -10,25 +10,45 @@ Features:
 
 from __future__ import annotations
 
+import threading
 import tkinter as tk
+from bisect import bisect_right
+from collections import defaultdict
 from tkinter import filedialog, messagebox
 from typing import Callable, Optional
 
 import customtkinter as ctk
+from sqlalchemy import select
 
-from db.database import get_session
+from db.database import get_session, get_reader_session
 from db.models import Folder, Deck
 from core.sidebar_ops import (
     rename_folder, rename_deck, move_deck,
     delete_folder, delete_deck,
     reset_deck_progress, export_deck_csv, get_all_folders,
 )
-from ui.widgets import Theme, GhostButton, AccentButton, Separator
+from ui.widgets import Theme, AccentButton, Separator
+
+# Interned indent prefixes — deep enough for any sane tree, computed once
+# instead of "  " * indent per rendered row.
+_INDENTS = tuple("  " * i for i in range(16))
+
+# Export-filename sanitation in one C-level translate: non-alphanumeric
+# ASCII (except space/underscore/dash) becomes "_", the rest passes.
+_SANITIZE_TABLE = {
+    i: "_" for i in range(128) if not (chr(i).isalnum() or chr(i) in " _-")
+}
 
 
 class Sidebar(ctk.CTkFrame):
     """Left-hand sidebar with folder/deck navigation."""
 
+    # Tree virtualization: the canvas scrollregion spans every visible
+    # row, but pooled row widgets only exist for the viewport.  The pool
+    # starts at this size and grows with the canvas on resize.
+    _ROW_H = 30
+    _ROW_POOL = 30
+
     def __init__(
         self,
         master,
@@ -48,7 +68,42 @@ class Sidebar(ctk.CTkFrame):
         # Drag & drop state
         self._drag_deck_id: int | None = None
         self._drag_ghost: ctk.CTkLabel | None = None
-        self._folder_rows: dict[int, ctk.CTkFrame] = {}   # folder_id → row widget
+        self._folder_rows: dict[int, tk.Label] = {}   # folder_id → visible row
+        self._drop_targets: list[tuple[int, int, int, tk.Label]] = []
+        self._drop_starts: list[int] = []
+        self._drop_x0 = self._drop_x1 = 0
+        self._last_hover_fid: int | None = None
+        self._motion_after_id: str | None = None
+
+        # Flat list of visible-row specs:
+        # (kind, id, name, display_text, folder_id) — rebuilt by
+        # _rerender, rendered by the recycled row pool.
+        self._flat_rows: list[tuple] = []
+        self._tree_empty_lbl: ctk.CTkLabel | None = None
+
+        # Context menus are created once on first right-click and then
+        # cleared/refilled per open — no Tk widget construction on the
+        # interactive path.
+        self._folder_menu: tk.Menu | None = None
+        self._deck_menu: tk.Menu | None = None
+        self._move_menu: tk.Menu | None = None
+
+        # Folder list for the "Move to…" submenu and the import picker —
+        # fetched once, reused until a folder mutation invalidates it, so
+        # opening a context menu never waits on a query.
+        self._folders_cache: list[tuple[int, str]] | None = None
+
+        # Background-refresh state: one load in flight at a time, and a
+        # refresh requested meanwhile re-arms instead of stacking up.
+        self._loading = False
+        self._refresh_again = False
+        self._folders_by_parent: dict = defaultdict(list)
+        self._decks_by_folder: dict = defaultdict(list)
+
+        # Folders start collapsed; only expanded subtrees get rendered,
+        # so widget construction scales with visible rows, not the whole
+        # tree.  The set survives refreshes.
+        self._expanded: set[int] = set()
 
         # ── Header ──
         header = ctk.CTkFrame(self, fg_color="transparent")
@@ -73,129 +128,273 @@ class Sidebar(ctk.CTkFrame):
         Separator(self).pack(fill="x", padx=16, pady=(8, 4))
 
         # ── Scrollable tree ──
-        self._tree_frame = ctk.CTkScrollableFrame(
-            self, fg_color="transparent", corner_radius=0,
-            scrollbar_button_color=Theme.BORDER,
-            scrollbar_button_hover_color=Theme.ACCENT,
+        # Raw canvas + inner frame instead of CTkScrollableFrame: CTk
+        # layers a canvas under every widget, so the stock scrollable
+        # frame pays that per row — here one shared canvas scrolls the
+        # whole tree.
+        tree_wrap = ctk.CTkFrame(self, fg_color="transparent")
+        tree_wrap.pack(fill="both", expand=True, padx=4, pady=4)
+        self._tree_canvas = tk.Canvas(
+            tree_wrap, bg=Theme.BG_SIDEBAR, highlightthickness=0, bd=0
+        )
+        self._tree_sb = ctk.CTkScrollbar(
+            tree_wrap, command=self._tree_canvas.yview,
+            button_color=Theme.BORDER, button_hover_color=Theme.ACCENT,
+        )
+        self._tree_sb.pack(side="right", fill="y")
+        self._tree_canvas.pack(side="left", fill="both", expand=True)
+        self._tree_canvas.configure(
+            yscrollcommand=lambda a, b: (self._tree_sb.set(a, b),
+                                         self._update_tree_rows())
         )
-        self._tree_frame.pack(fill="both", expand=True, padx=4, pady=4)
+        self._tree_canvas.bind("<Configure>", self._on_tree_resize)
+        for seq in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self._tree_canvas.bind(seq, self._on_tree_wheel)
+
+        # Virtualized row pool: widget count is O(viewport), however
+        # many folders and decks exist.  Handlers read the bound spec
+        # off the label, so recycled rows never capture stale ids.
+        self._tree_pool: list[tuple[int, tk.Label]] = []
+        self._tree_width = 0
+        for _ in range(self._ROW_POOL):
+            self._add_tree_row()
 
         self.refresh()
 
+    def _add_tree_row(self) -> None:
+        lbl = tk.Label(
+            self._tree_canvas, text="", anchor="w", padx=10,
+            bg=Theme.BG_SIDEBAR, fg=Theme.TEXT_PRIMARY,
+            font=(Theme.FONT_FAMILY, 11),
+        )
+        lbl._spec = None
+        lbl._last_text = None
+        lbl._last_bg = None
+        lbl.bind("<ButtonPress-1>",
+                 lambda e, l=lbl: self._on_row_press(e, l))
+        lbl.bind("<B1-Motion>", self._drag_motion)
+        lbl.bind("<ButtonRelease-1>",
+                 lambda e, l=lbl: self._on_row_release(e, l))
+        lbl.bind("<Button-3>",
+                 lambda e, l=lbl: self._on_row_context(e, l))
+        for seq in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            lbl.bind(seq, self._on_tree_wheel)
+        item = self._tree_canvas.create_window(
+            0, 0, window=lbl, anchor="nw",
+            height=self._ROW_H, state="hidden",
+        )
+        if self._tree_width:
+            self._tree_canvas.itemconfigure(item, width=self._tree_width)
+        self._tree_pool.append((item, lbl))
+
+    def _on_tree_resize(self, event) -> None:
+        # Grow the pool to cover the viewport — a maximized tall window
+        # needs more live rows than the initial allotment.
+        needed = event.height // self._ROW_H + 2
+        while len(self._tree_pool) < needed:
+            self._add_tree_row()
+        self._tree_width = event.width
+        for item, _lbl in self._tree_pool:
+            self._tree_canvas.itemconfigure(item, width=event.width)
+        self._update_tree_rows()
+
+    def _on_row_press(self, event, lbl) -> None:
+        spec = lbl._spec
+        if spec is not None and spec[0] == "deck":
+            self._drag_start(event, spec[1])
+
+    def _on_row_release(self, event, lbl) -> None:
+        spec = lbl._spec
+        dragged = self._drag_ghost is not None
+        self._drag_drop(event)
+        if dragged or spec is None:
+            return
+        # No motion happened — treat the release as a plain click.
+        if spec[0] == "deck":
+            self._select_deck(spec[1])
+        else:
+            self._toggle_folder(spec[1])
+
+    def _on_row_context(self, event, lbl) -> None:
+        spec = lbl._spec
+        if spec is None:
+            return
+        kind, item_id, name, _text, folder_id = spec
+        if kind == "deck":
+            self._deck_context_menu(event, item_id, name, folder_id)
+        else:
+            self._folder_context_menu(event, item_id, name)
+
+    def _on_tree_wheel(self, event) -> None:
+        if getattr(event, "num", None) == 4:
+            step = -1
+        elif getattr(event, "num", None) == 5:
+            step = 1
+        else:
+            step = -int(event.delta / 120)
+        self._tree_canvas.yview_scroll(step, "units")
+
     # ==================================================================
     #  PUBLIC
     # ==================================================================
 
     def refresh(self) -> None:
-        """Rebuild the tree from the database."""
-        for w in self._tree_frame.winfo_children():
-            w.destroy()
-        self._folder_rows.clear()
+        """Rebuild the tree from the database.
 
-        session = get_session()
-        try:
-            roots = (
-                session.query(Folder)
-                .filter(Folder.parent_id.is_(None))
-                .order_by(Folder.name)
-                .all()
+        The queries and map building run on a worker thread; only the
+        widget re-pack happens on the Tk loop.
+        """
+        if self._loading:
+            self._refresh_again = True
+            return
+        self._loading = True
+        self._refresh_again = False
+        threading.Thread(target=self._load_tree_bg, daemon=True).start()
+
+    def _load_tree_bg(self) -> None:
+        # Two column queries cover the whole tree — one for folders, one
+        # for decks — instead of two ORM queries per folder (N+1).  The
+        # session is closed before results are handed to the Tk thread;
+        # rendering then walks plain in-memory parent → children maps.
+        with get_reader_session() as session:
+            folders = session.execute(
+                select(Folder.id, Folder.name, Folder.parent_id).order_by(Folder.name)
+            ).all()
+            decks = session.execute(
+                select(Deck.id, Deck.name, Deck.folder_id).order_by(Deck.name)
+            ).all()
+
+        folders_by_parent = defaultdict(list)
+        for folder in folders:
+            folders_by_parent[folder.parent_id].append(folder)
+        decks_by_folder = defaultdict(list)
+        for deck in decks:
+            decks_by_folder[deck.folder_id].append(deck)
+
+        self.after_idle(self._apply_tree, folders, folders_by_parent, decks_by_folder)
+
+    def _apply_tree(self, folders, folders_by_parent, decks_by_folder) -> None:
+        self._loading = False
+        if self._refresh_again:
+            # Data changed while we were loading — go again.
+            self.refresh()
+            return
+
+        # Every mutation path funnels through refresh(), so refilling the
+        # menu cache here keeps it current without per-call invalidation.
+        self._folders_cache = [(f.id, f.name) for f in folders]
+        self._folders_by_parent = folders_by_parent
+        self._decks_by_folder = decks_by_folder
+
+        self._rerender()
+
+    def _rerender(self) -> None:
+        """Rebuild the flat row list and repaint the viewport — no queries."""
+        rows: list[tuple] = []
+        roots = self._folders_by_parent.get(None, ())
+
+        # Iterative preorder walk — folder, its decks, then its
+        # subfolders.  Collapsed folders contribute a single row.
+        stack = [(folder, 0) for folder in reversed(roots)]
+        while stack:
+            folder, indent = stack.pop()
+            pad = _INDENTS[indent] if indent < len(_INDENTS) else "  " * indent
+            arrow = "▾" if folder.id in self._expanded else "▸"
+            rows.append(
+                ("folder", folder.id, folder.name,
+                 f"{pad}{arrow} 📁 {folder.name}", None)
             )
-            if not roots:
-                ctk.CTkLabel(
-                    self._tree_frame,
+            if folder.id not in self._expanded:
+                continue
+            dpad = _INDENTS[indent + 1] if indent + 1 < len(_INDENTS) else "  " * (indent + 1)
+            for deck in self._decks_by_folder.get(folder.id, ()):
+                rows.append(
+                    ("deck", deck.id, deck.name,
+                     f"{dpad}🃏 {deck.name}", folder.id)
+                )
+            for child in reversed(self._folders_by_parent.get(folder.id, ())):
+                stack.append((child, indent + 1))
+
+        self._flat_rows = rows
+
+        if not rows:
+            if self._tree_empty_lbl is None:
+                self._tree_empty_lbl = ctk.CTkLabel(
+                    self._tree_canvas,
                     text="No folders yet.\nClick '＋ Folder' to start.",
                     text_color=Theme.TEXT_MUTED,
                     font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=13),
                     justify="center",
-                ).pack(pady=40)
-                return
+                )
+            self._tree_empty_lbl.place(relx=0.5, rely=0.15, anchor="center")
+        elif self._tree_empty_lbl is not None:
+            self._tree_empty_lbl.place_forget()
 
-            for folder in roots:
-                self._render_folder(folder, indent=0)
-        finally:
-            session.close()
+        self._tree_canvas.configure(
+            scrollregion=(0, 0, 0, len(rows) * self._ROW_H)
+        )
+        self._update_tree_rows()
 
     # ==================================================================
     #  RENDER
     # ==================================================================
 
-    def _render_folder(self, folder: Folder, indent: int) -> None:
-        row = ctk.CTkFrame(self._tree_frame, fg_color="transparent")
-        row.pack(fill="x", pady=1)
-        self._folder_rows[folder.id] = row
+    def _row_base_bg(self, spec: tuple) -> str:
+        if spec is not None and spec[0] == "folder" \
+                and spec[1] == self._selected_folder_id:
+            return Theme.BG_CARD
+        return Theme.BG_SIDEBAR
+
+    @staticmethod
+    def _set_row_bg(lbl: tk.Label, bg: str) -> None:
+        if lbl._last_bg != bg:
+            lbl.configure(bg=bg)
+            lbl._last_bg = bg
+
+    def _update_tree_rows(self, *_args) -> None:
+        """Bind the pooled row widgets to whatever rows are in view."""
+        canvas = self._tree_canvas
+        rows = self._flat_rows
+        first = int(canvas.canvasy(0) // self._ROW_H)
+        first = max(0, min(first, max(0, len(rows) - len(self._tree_pool))))
 
-        prefix = "  " * indent + "📁 "
-        is_sel = (self._selected_folder_id == folder.id)
-
-        btn = GhostButton(
-            row,
-            text=f"{prefix}{folder.name}",
-            command=lambda fid=folder.id: self._select_folder(fid),
-            fg_color=Theme.BG_CARD if is_sel else "transparent",
-        )
-        btn.pack(side="left", fill="x", expand=True, padx=(4, 0))
-
-        # Right-click on folder button
-        btn.bind("<Button-3>",
-                 lambda e, fid=folder.id, fn=folder.name:
-                     self._folder_context_menu(e, fid, fn))
-
-        # Decks inside this folder
-        session = get_session()
-        try:
-            decks = (
-                session.query(Deck)
-                .filter(Deck.folder_id == folder.id)
-                .order_by(Deck.name)
-                .all()
-            )
-            for deck in decks:
-                self._render_deck(deck, indent + 1)
-
-            children = (
-                session.query(Folder)
-                .filter(Folder.parent_id == folder.id)
-                .order_by(Folder.name)
-                .all()
-            )
-            for child in children:
-                self._render_folder(child, indent + 1)
-        finally:
-            session.close()
-
-    def _render_deck(self, deck: Deck, indent: int) -> None:
-        prefix = "  " * indent + "🃏 "
-        row = ctk.CTkFrame(self._tree_frame, fg_color="transparent")
-        row.pack(fill="x", pady=1)
-
-        btn = GhostButton(
-            row,
-            text=f"{prefix}{deck.name}",
-            command=lambda did=deck.id: self._select_deck(did),
-        )
-        btn.pack(side="left", fill="x", expand=True, padx=(4, 0))
-
-        # Right-click on deck button
-        btn.bind("<Button-3>",
-                 lambda e, did=deck.id, dn=deck.name, fid=deck.folder_id:
-                     self._deck_context_menu(e, did, dn, fid))
-
-        # ── Drag & Drop bindings ──
-        btn.bind("<ButtonPress-1>",
-                 lambda e, did=deck.id: self._drag_start(e, did), add="+")
-        btn.bind("<B1-Motion>", self._drag_motion)
-        btn.bind("<ButtonRelease-1>", self._drag_drop, add="+")
+        self._folder_rows.clear()
+        for slot, (item, lbl) in enumerate(self._tree_pool):
+            idx = first + slot
+            if idx >= len(rows):
+                if lbl._spec is not None:
+                    canvas.itemconfigure(item, state="hidden")
+                    lbl._spec = None
+                continue
+            spec = rows[idx]
+            canvas.coords(item, 0, idx * self._ROW_H)
+            if lbl._spec is None:
+                canvas.itemconfigure(item, state="normal")
+            lbl._spec = spec
+            if lbl._last_text != spec[3]:
+                lbl.configure(text=spec[3])
+                lbl._last_text = spec[3]
+            bg = self._row_base_bg(spec)
+            if lbl._last_bg != bg:
+                lbl.configure(bg=bg)
+                lbl._last_bg = bg
+            if spec[0] == "folder":
+                self._folder_rows[spec[1]] = lbl
 
     # ==================================================================
     #  CONTEXT MENU — FOLDER
     # ==================================================================
 
     def _folder_context_menu(self, event, folder_id: int, folder_name: str):
-        menu = tk.Menu(self, tearoff=0,
-                       bg="#1e2030", fg="#e2e4f0",
-                       activebackground=Theme.ACCENT, activeforeground="#fff",
-                       font=("Segoe UI", 10),
-                       relief="flat", bd=0)
+        if self._folder_menu is None:
+            self._folder_menu = tk.Menu(self, tearoff=0,
+                                        bg="#1e2030", fg="#e2e4f0",
+                                        activebackground=Theme.ACCENT,
+                                        activeforeground="#fff",
+                                        font=("Segoe UI", 10),
+                                        relief="flat", bd=0)
+        menu = self._folder_menu
+        menu.delete(0, "end")
 
         menu.add_command(label="✏️  Cambiar nombre",
                          command=lambda: self._rename_folder_dialog(folder_id, folder_name))
@@ -234,23 +433,29 @@ class Sidebar(ctk.CTkFrame):
 
     def _deck_context_menu(self, event, deck_id: int, deck_name: str,
                            current_folder_id: int):
-        menu = tk.Menu(self, tearoff=0,
-                       bg="#1e2030", fg="#e2e4f0",
-                       activebackground=Theme.ACCENT, activeforeground="#fff",
-                       font=("Segoe UI", 10),
-                       relief="flat", bd=0)
+        if self._deck_menu is None:
+            self._deck_menu = tk.Menu(self, tearoff=0,
+                                      bg="#1e2030", fg="#e2e4f0",
+                                      activebackground=Theme.ACCENT,
+                                      activeforeground="#fff",
+                                      font=("Segoe UI", 10),
+                                      relief="flat", bd=0)
+            self._move_menu = tk.Menu(self._deck_menu, tearoff=0,
+                                      bg="#1e2030", fg="#e2e4f0",
+                                      activebackground=Theme.ACCENT,
+                                      activeforeground="#fff",
+                                      font=("Segoe UI", 10))
+        menu = self._deck_menu
+        menu.delete(0, "end")
 
         menu.add_command(label="✏️  Cambiar nombre",
                          command=lambda: self._rename_deck_dialog(deck_id, deck_name))
 
         # ── Move to… submenu ──
-        folders = get_all_folders()
+        folders = self._get_folders_cached()
         if len(folders) > 1:
-            move_menu = tk.Menu(menu, tearoff=0,
-                                bg="#1e2030", fg="#e2e4f0",
-                                activebackground=Theme.ACCENT,
-                                activeforeground="#fff",
-                                font=("Segoe UI", 10))
+            move_menu = self._move_menu
+            move_menu.delete(0, "end")
             for fid, fname in folders:
                 if fid == current_folder_id:
                     continue
@@ -300,17 +505,30 @@ class Sidebar(ctk.CTkFrame):
             self.refresh()
 
     def _export_deck(self, deck_id: int, deck_name: str):
-        safe = "".join(c if c.isalnum() or c in " _-" else "_" for c in deck_name)
+        safe = deck_name.translate(_SANITIZE_TABLE)
         fp = filedialog.asksaveasfilename(
             title="Exportar mazo como CSV",
             defaultextension=".csv",
             initialfile=f"{safe}.csv",
             filetypes=[("CSV", "*.csv"), ("All files", "*.*")],
         )
-        if fp:
-            n = export_deck_csv(deck_id, fp)
-            messagebox.showinfo("Exportación completa",
-                                f"Se exportaron {n} tarjetas a:\n{fp}")
+        if not fp:
+            return
+
+        # Export on a worker thread so a large deck doesn't freeze the
+        # UI; the result dialog is posted back to the Tk thread.
+        def _worker():
+            try:
+                n = export_deck_csv(deck_id, fp)
+            except Exception as exc:
+                self.after(0, lambda exc=exc: messagebox.showerror(
+                    "Exportación fallida", str(exc)))
+                return
+            self.after(0, lambda: messagebox.showinfo(
+                "Exportación completa",
+                f"Se exportaron {n} tarjetas a:\n{fp}"))
+
+        threading.Thread(target=_worker, daemon=True).start()
 
     def _confirm_delete_deck(self, deck_id: int, name: str):
         ok = messagebox.askyesno(
@@ -329,11 +547,60 @@ class Sidebar(ctk.CTkFrame):
     def _drag_start(self, event, deck_id: int):
         self._drag_deck_id = deck_id
 
+    def _snapshot_drop_targets(self) -> None:
+        """Capture folder-row geometry once per drag.
+
+        Rows are vertically stacked and don't move during a drag, so the
+        per-motion hit test can binary-search these y-intervals instead
+        of making four winfo round-trips per folder per mouse move.
+        Only on-screen folder rows exist (virtualized pool), which is
+        exactly the set a drop can land on.
+        """
+        targets = []
+        for fid, row in self._folder_rows.items():
+            try:
+                y0 = row.winfo_rooty()
+                targets.append((y0, y0 + row.winfo_height(), fid, row))
+            except tk.TclError:
+                pass
+        targets.sort()
+        self._drop_targets = targets
+        self._drop_starts = [t[0] for t in targets]
+        try:
+            self._drop_x0 = self._tree_canvas.winfo_rootx()
+            self._drop_x1 = self._drop_x0 + self._tree_canvas.winfo_width()
+        except tk.TclError:
+            self._drop_x0 = self._drop_x1 = 0
+        self._last_hover_fid: int | None = None
+
+    def _hit_drop_target(self, abs_x: int, abs_y: int):
+        """Return the ``(folder_id, row)`` under the cursor, or ``(None, None)``."""
+        if not (self._drop_x0 <= abs_x <= self._drop_x1):
+            return None, None
+        i = bisect_right(self._drop_starts, abs_y) - 1
+        if i >= 0:
+            y0, y1, fid, row = self._drop_targets[i]
+            if y0 <= abs_y <= y1:
+                return fid, row
+        return None, None
+
     def _drag_motion(self, event):
+        if self._drag_deck_id is None:
+            return
+        # Coalesce motion bursts: the mouse reports far faster than the
+        # ghost/highlight need repainting, so handle at most one motion
+        # per ~16 ms (the cursor position is re-read when the timer
+        # fires, so nothing is lost by dropping intermediate events).
+        if self._motion_after_id is None:
+            self._motion_after_id = self.after(16, self._do_motion)
+
+    def _do_motion(self):
+        self._motion_after_id = None
         if self._drag_deck_id is None:
             return
 
-        # Create ghost label on first motion
+        # Create ghost label on first motion; geometry snapshot happens
+        # here too, so plain clicks never pay for it.
         if self._drag_ghost is None:
             self._drag_ghost = ctk.CTkLabel(
                 self.winfo_toplevel(),
@@ -342,6 +609,7 @@ class Sidebar(ctk.CTkFrame):
                 fg_color=Theme.ACCENT, text_color="#fff",
                 corner_radius=8, width=100, height=26,
             )
+            self._snapshot_drop_targets()
 
         # Position ghost near cursor
         rx, ry = self.winfo_toplevel().winfo_pointerxy()
@@ -353,53 +621,54 @@ class Sidebar(ctk.CTkFrame):
         self._highlight_drop_target(rx, ry)
 
     def _highlight_drop_target(self, abs_x: int, abs_y: int):
-        """Highlight the folder row under the cursor."""
-        for fid, row in self._folder_rows.items():
-            try:
-                rx = row.winfo_rootx()
-                ry = row.winfo_rooty()
-                rw = row.winfo_width()
-                rh = row.winfo_height()
-                if rx <= abs_x <= rx + rw and ry <= abs_y <= ry + rh:
-                    row.configure(fg_color=Theme.BG_CARD_HOVER)
-                else:
-                    row.configure(fg_color="transparent")
-            except tk.TclError:
-                pass
+        """Highlight the folder row under the cursor.
+
+        Only the rows whose state actually changed are reconfigured —
+        at most two per transition, none while hovering the same row.
+        """
+        fid, row = self._hit_drop_target(abs_x, abs_y)
+        if fid == self._last_hover_fid:
+            return
+        prev = self._folder_rows.get(self._last_hover_fid)
+        self._last_hover_fid = fid
+        try:
+            if prev is not None:
+                self._set_row_bg(prev, self._row_base_bg(prev._spec))
+            if row is not None:
+                self._set_row_bg(row, Theme.BG_CARD_HOVER)
+        except tk.TclError:
+            pass
 
     def _drag_drop(self, event):
         deck_id = self._drag_deck_id
         self._drag_deck_id = None
 
+        if self._motion_after_id is not None:
+            self.after_cancel(self._motion_after_id)
+            self._motion_after_id = None
+
         # Remove ghost
         if self._drag_ghost is not None:
             self._drag_ghost.destroy()
             self._drag_ghost = None
+        else:
+            return  # no motion happened — plain click, nothing to drop
 
         if deck_id is None:
             return
 
-        # Find which folder was dropped onto
+        # Find which folder was dropped onto (same snapshot as motion)
         abs_x, abs_y = self.winfo_toplevel().winfo_pointerxy()
-        target_fid = None
-        for fid, row in self._folder_rows.items():
-            try:
-                rx = row.winfo_rootx()
-                ry = row.winfo_rooty()
-                rw = row.winfo_width()
-                rh = row.winfo_height()
-                if rx <= abs_x <= rx + rw and ry <= abs_y <= ry + rh:
-                    target_fid = fid
-                    break
-            except tk.TclError:
-                pass
+        target_fid, _row = self._hit_drop_target(abs_x, abs_y)
 
-        # Reset folder highlights
-        for row in self._folder_rows.values():
+        # Reset the hover highlight
+        hovered = self._folder_rows.get(self._last_hover_fid)
+        if hovered is not None:
             try:
-                row.configure(fg_color="transparent")
+                self._set_row_bg(hovered, self._row_base_bg(hovered._spec))
             except tk.TclError:
                 pass
+        self._last_hover_fid = None
 
         if target_fid is not None:
             move_deck(deck_id, target_fid)
@@ -419,9 +688,14 @@ class Sidebar(ctk.CTkFrame):
         # No folder selected — show picker dialog
         self._show_import_picker()
 
+    def _get_folders_cached(self) -> list[tuple[int, str]]:
+        if self._folders_cache is None:
+            self._folders_cache = get_all_folders()
+        return self._folders_cache
+
     def _show_import_picker(self):
         """Modal dialog: create new folder or select existing one."""
-        folders = get_all_folders()
+        folders = self._get_folders_cached()
 
         dlg = ctk.CTkToplevel(self)
         dlg.title("¿Dónde importar?")
@@ -502,9 +776,21 @@ class Sidebar(ctk.CTkFrame):
     #  BASIC ACTIONS
     # ==================================================================
 
+    def _toggle_folder(self, folder_id: int) -> None:
+        """Click selects the folder and toggles its subtree."""
+        if folder_id in self._expanded:
+            self._expanded.discard(folder_id)
+        else:
+            self._expanded.add(folder_id)
+        self._select_folder(folder_id)
+        self._rerender()
+
     def _select_folder(self, folder_id: int) -> None:
+        # Selection is just a background swap on the pooled rows — the
+        # viewport repaint diffs against _last_bg, so at most two rows
+        # actually get reconfigured.
         self._selected_folder_id = folder_id
-        self.refresh()   # re-render to highlight selected
+        self._update_tree_rows()
 
     def _select_deck(self, deck_id: int) -> None:
         if self._on_deck_select:
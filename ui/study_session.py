@@ -14,78 +14,184 @@ import math
 import os
 import random
 import subprocess
+import sys
 import tempfile
 import threading
+import time
 import tkinter as tk
-from dataclasses import dataclass, field
-from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
 from typing import Callable, List
 
 import customtkinter as ctk
+from sqlalchemy import bindparam, func, select, update
 
 from db.database import get_session
 from db.models import Card, ReviewLog
-from core.srs_engine import get_due_cards, get_all_cards, record_review
-from ui.widgets import Theme
+from core.srs_engine import (
+    calculate_sm2,
+    get_all_cards,
+    invalidate_deck_stats,
+)
+from ui.widgets import Theme, get_font
 
 log = logging.getLogger(__name__)
 
 
 # ── History entry ────────────────────────────────────────────────────
-@dataclass
+@dataclass(slots=True)
 class _HistoryEntry:
-    """One answered card in the visual history stack."""
+    """One TRACKED answer in the visual history stack.
+
+    Untracked (cram-mode) answers need no SM-2 snapshot — they go on
+    the stack as a bare card index instead.
+    """
     card_id: int
     card_idx: int           # position in self._cards at the time
-    was_tracked: bool       # was tracking ON when answered?
     quality: int
-    # SM-2 snapshot (only meaningful when was_tracked)
+    # SM-2 snapshot restored on undo
     prev_reps: int = 0
     prev_ease: float = 2.5
     prev_interval: int = 0
     prev_next: datetime | None = None
-    log_id: int | None = None   # ReviewLog.id (None if sandbox)
 
 
 # ── DB helpers ───────────────────────────────────────────────────────
-def _count_known(deck_id: int) -> int:
-    now = datetime.now(timezone.utc)
-    s = get_session()
+
+# Known-count cache, same shape as srs_engine's deck_stats cache: the
+# aggregate is invalidated when this module flushes reviews and expires
+# on a short TTL anyway, since "known" depends on the clock.
+_KNOWN_TTL = 30.0  # seconds
+_known_cache: dict[int, tuple[float, int]] = {}
+
+# Built once at import: cache misses execute the same statement object
+# every time, so SQLAlchemy's compiled-SQL cache hits without a fresh
+# construct/compile per call.
+_COUNT_KNOWN_STMT = (
+    select(func.count())
+    .select_from(Card)
+    .where(
+        Card.deck_id == bindparam("did"),
+        Card.repetitions >= 1,
+        Card.next_review > bindparam("now"),
+    )
+)
+
+
+def invalidate_known(deck_id: int | None = None) -> None:
+    """Drop the cached known-count for one deck, or all when None."""
+    if deck_id is None:
+        _known_cache.clear()
+    else:
+        _known_cache.pop(deck_id, None)
+
+
+def _count_known(deck_id: int, session=None) -> int:
+    """Count known cards, reusing *session* when the caller has one open."""
+    cached = _known_cache.get(deck_id)
+    if cached is not None and time.monotonic() - cached[0] < _KNOWN_TTL:
+        return cached[1]
+
+    owned = session is None
+    s = get_session() if owned else session
     try:
-        return s.query(Card).filter(
-            Card.deck_id == deck_id,
-            Card.repetitions >= 1,
-            Card.next_review > now,
-        ).count()
+        count = s.execute(
+            _COUNT_KNOWN_STMT,
+            {"did": deck_id, "now": datetime.now(timezone.utc)},
+        ).scalar_one()
     finally:
-        s.close()
+        if owned:
+            s.close()
+    _known_cache[deck_id] = (time.monotonic(), count)
+    return count
 
 
 # ── Audio ────────────────────────────────────────────────────────────
 _AUDIO_DIR = os.path.join(tempfile.gettempdir(), "vocabrecall_audio")
 os.makedirs(_AUDIO_DIR, exist_ok=True)
 
+# Names of MP3s already synthesized — one listdir at import replaces a
+# stat per play, and repeat plays go straight to the player.  The lock
+# guards the set because playback runs on worker threads.
+_audio_cache = set(os.listdir(_AUDIO_DIR))
+_audio_lock = threading.Lock()
 
-def _play_audio(word: str) -> None:
+# Maps every non-alphanumeric ASCII codepoint to "_"; unmapped
+# characters (letters, digits, umlauts) pass through, so one C-level
+# translate replaces the per-character Python loop.
+_SANITIZE_TABLE = {i: "_" for i in range(128) if not chr(i).isalnum()}
+
+# One reusable worker serializes synthesis: mashing the speaker button
+# queues plays instead of spawning a thread (and a gTTS request) each.
+# Clicks that land while a synthesis is still running are dropped — the
+# tracked future acts as a one-slot queue, so audio never stacks up.
+_TTS_EXEC = ThreadPoolExecutor(max_workers=1)
+_tts_future = None
+
+
+def _ensure_audio(word: str) -> str | None:
+    """Synthesize *word* into the on-disk cache; return the MP3 path."""
     try:
         from gtts import gTTS
     except ImportError:
-        log.warning("gTTS not installed – pip install gtts"); return
+        log.warning("gTTS not installed – pip install gtts"); return None
     try:
-        safe = "".join(c if c.isalnum() else "_" for c in word)
-        fp = os.path.join(_AUDIO_DIR, f"{safe}.mp3")
-        if not os.path.exists(fp):
+        safe = word.translate(_SANITIZE_TABLE)
+        fname = f"{safe}.mp3"
+        fp = os.path.join(_AUDIO_DIR, fname)
+        with _audio_lock:
+            cached = fname in _audio_cache
+        if not cached:
             gTTS(text=word, lang="de").save(fp)
-        cmd = (
-            f'powershell -WindowStyle Hidden -Command "'
-            f"Add-Type -AssemblyName presentationCore;"
-            f"$p=New-Object System.Windows.Media.MediaPlayer;"
-            f"$p.Open('{fp}');$p.Play();Start-Sleep -Seconds 3\""
-        )
-        subprocess.Popen(cmd, shell=True,
-                         stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            with _audio_lock:
+                _audio_cache.add(fname)
+        return fp
     except Exception as e:
         log.warning("TTS failed: %s", e)
+        return None
+
+
+def _next_review_key(card):
+    """Sort key tolerant of naive datetimes read back from SQLite."""
+    nr = card.next_review
+    return nr if nr.tzinfo is not None else nr.replace(tzinfo=timezone.utc)
+
+
+def _display_word(card) -> str:
+    """Formatted front text, memoized on the card — flip hot path."""
+    word = getattr(card, "_display_front", None)
+    if word is None:
+        word = f"{card.article} {card.front}" if card.article else card.front
+        card._display_front = word
+    return word
+
+
+def _play_audio(word: str) -> None:
+    fp = _ensure_audio(word)
+    if fp is not None:
+        _play_file(fp)
+
+
+def _play_file(fp: str) -> None:
+    """Start async playback of *fp* — runs on the TTS worker thread."""
+    if sys.platform == "win32":
+        # In-process winmm MCI call: no PowerShell spawn, no WPF
+        # assembly load (~hundreds of ms per play).  Reusing one alias
+        # stops any still-running clip first.
+        import ctypes
+
+        winmm = ctypes.windll.winmm
+        winmm.mciSendStringW("close vocab_tts", None, 0, None)
+        winmm.mciSendStringW(
+            f'open "{fp}" type mpegvideo alias vocab_tts', None, 0, None
+        )
+        winmm.mciSendStringW("play vocab_tts", None, 0, None)
+    else:
+        subprocess.Popen(
+            ["ffplay", "-nodisp", "-autoexit", "-loglevel", "quiet", fp],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
 
 
 # ── Fade constants ───────────────────────────────────────────────────
@@ -93,6 +199,18 @@ _FADE_STEPS = 6
 _FADE_MS    = 16
 _ALPHA_MIN  = 0.82
 
+# The easing curve is a pure function of the step index, so both alpha
+# schedules are computed once at import — the per-tick work is a table
+# lookup plus one Tk attributes call.
+_FADE_SCHED_DIM = tuple(
+    1.0 - (1.0 - _ALPHA_MIN) * math.sin(i / _FADE_STEPS * math.pi / 2)
+    for i in range(_FADE_STEPS + 1)
+)
+_FADE_SCHED_BRIGHT = tuple(
+    _ALPHA_MIN + (1.0 - _ALPHA_MIN) * math.sin(i / _FADE_STEPS * math.pi / 2)
+    for i in range(_FADE_STEPS + 1)
+)
+
 
 # =====================================================================
 #  StudySessionView
@@ -133,13 +251,32 @@ class StudySessionView(ctk.CTkToplevel):
         self._track = True          # ON = SM-2 mode, OFF = cram all
         self._showing_back = False
         self._anim = False
+        self._last_alpha = 1.0
+        self._upd_pending = False
         self._history: List[_HistoryEntry] = []   # visual history (always works)
         self._done = False
         self._shuffled = False
-
-        self._known  = _count_known(deck_id)
-        self._s_known = 0
-
+        # Private RNG — no contention on the random module's global state.
+        self._rng = random.Random()
+
+        # Reviews are graded in memory and written in ONE transaction when
+        # the session ends (or the mode toggles) — one fsync instead of
+        # one commit per answered card.
+        self._pending_cards: dict[int, dict] = {}   # card_id → SM-2 fields
+        self._pending_logs: list[dict] = []          # ReviewLog mappings
+
+        # One session covers both window-open queries — the known count
+        # and the deck snapshot — instead of a connection each.  The
+        # snapshot serves both modes: due cards are filtered from it in
+        # Python, so flipping the mode switch never re-queries the deck.
+        # Answers mutate these same objects in place, keeping it current.
+        s = get_session()
+        try:
+            self._known = _count_known(deck_id, s)
+            self._s_known = 0
+            self._all: List[Card] = get_all_cards(s, self._deck_id)
+        finally:
+            s.close()
         self._load_due()
         self._prog = len(self._cards)
 
@@ -149,6 +286,7 @@ class StudySessionView(ctk.CTkToplevel):
 
         self._face_front: ctk.CTkFrame | None = None
         self._face_back:  ctk.CTkFrame | None = None
+        self._summ_frame: ctk.CTkFrame | None = None
 
         if not self._cards:
             self._build_empty()
@@ -158,41 +296,41 @@ class StudySessionView(ctk.CTkToplevel):
 
     # ── data loading ─────────────────────────────────────────────────
     def _load_due(self):
-        """Load only due cards (SM-2 mode)."""
-        s = get_session()
-        try:
-            self._cards = get_due_cards(s, self._deck_id, limit=200)
-        finally:
-            s.close()
-        random.shuffle(self._cards)
+        """Load only due cards (SM-2 mode) — filtered from the snapshot."""
+        now = datetime.now(timezone.utc)
+        naive_now = now.replace(tzinfo=None)
+        due = [
+            c for c in self._all
+            if c.next_review is not None
+            and c.next_review <= (now if c.next_review.tzinfo else naive_now)
+        ]
+        due.sort(key=_next_review_key)  # most overdue first, like the SQL path
+        self._cards = due[:200]
+        self._rng.shuffle(self._cards)
+        self._cards_by_id = {c.id: c for c in self._cards}
         self._idx = 0
 
     def _load_all(self):
         """Load ALL cards in the deck (cram/review mode)."""
-        s = get_session()
-        try:
-            self._cards = get_all_cards(s, self._deck_id)
-        finally:
-            s.close()
-        random.shuffle(self._cards)
+        self._cards = list(self._all)
+        self._rng.shuffle(self._cards)
+        self._cards_by_id = {c.id: c for c in self._cards}
         self._idx = 0
 
     # ── empty state ──────────────────────────────────────────────────
     def _build_empty(self):
         f = ctk.CTkFrame(self, fg_color="transparent"); f.pack(expand=True)
         ctk.CTkLabel(f, text="✅  No hay tarjetas pendientes",
-                     font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=22,
-                                      weight="bold"),
+                     font=get_font(22, "bold"),
                      text_color=self.CKNOWN).pack(pady=(0, 12))
         ctk.CTkLabel(f,
                      text=f"Ya conoces {self._known} tarjetas.\n¡Buen trabajo!",
-                     font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=14),
+                     font=get_font(14),
                      text_color=self.CMUT, justify="center").pack(pady=(0, 24))
         ctk.CTkButton(f, text="Cerrar", command=self._close,
                       fg_color=self.CACC, hover_color="#6958d9",
                       width=120, height=38, corner_radius=8,
-                      font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=14,
-                                       weight="bold")).pack()
+                      font=get_font(14, "bold")).pack()
 
     # ══════════════════════════════════════════════════════════════════
     #  UI LAYOUT
@@ -210,33 +348,33 @@ class StudySessionView(ctk.CTkToplevel):
         lf = ctk.CTkFrame(self._counters_frame, fg_color="transparent")
         lf.pack(side="left", padx=24, pady=12)
         ctk.CTkLabel(lf, text="🔄",
-                     font=ctk.CTkFont(size=16)).pack(side="left", padx=(0, 6))
+                     font=get_font(16, family=None)).pack(side="left", padx=(0, 6))
         ctk.CTkLabel(lf, text="En progreso:",
-                     font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=13),
+                     font=get_font(13),
                      text_color=self.CMUT).pack(side="left", padx=(0, 6))
         self._lp = ctk.CTkLabel(
             lf, text=str(self._prog),
-            font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=18, weight="bold"),
+            font=get_font(18, "bold"),
             text_color=self.CPROG)
         self._lp.pack(side="left")
 
         rf = ctk.CTkFrame(self._counters_frame, fg_color="transparent")
         rf.pack(side="left", padx=(32, 24), pady=12)
         ctk.CTkLabel(rf, text="✅",
-                     font=ctk.CTkFont(size=16)).pack(side="left", padx=(0, 6))
+                     font=get_font(16, family=None)).pack(side="left", padx=(0, 6))
         ctk.CTkLabel(rf, text="Conocida:",
-                     font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=13),
+                     font=get_font(13),
                      text_color=self.CMUT).pack(side="left", padx=(0, 6))
         self._lk = ctk.CTkLabel(
             rf, text=str(self._known),
-            font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=18, weight="bold"),
+            font=get_font(18, "bold"),
             text_color=self.CKNOWN)
         self._lk.pack(side="left")
 
         # Col 0 — sandbox label (same cell, initially hidden)
         self._sandbox_lbl = ctk.CTkLabel(
             hdr, text="📖  Modo Repaso — sin seguimiento",
-            font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=13, weight="bold"),
+            font=get_font(13, "bold"),
             text_color=self.CMUT)
         self._sandbox_lbl.grid(row=0, column=0, sticky="w", padx=24, pady=12)
         self._sandbox_lbl.grid_remove()  # hidden until switch OFF
@@ -244,7 +382,7 @@ class StudySessionView(ctk.CTkToplevel):
         # Col 1 — center card counter label
         self._lc = ctk.CTkLabel(
             hdr, text="",
-            font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=13),
+            font=get_font(13),
             text_color=self.CMUT)
         self._lc.grid(row=0, column=1, sticky="")
 
@@ -262,7 +400,7 @@ class StudySessionView(ctk.CTkToplevel):
         sf.pack(side="left", padx=20, pady=16)
         self._sw = ctk.CTkSwitch(
             sf, text="Seguir progreso",
-            font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=12),
+            font=get_font(12),
             text_color=self.CMUT,
             progress_color=self.CACC, button_color=self.CACC,
             fg_color="#2a2d40", command=self._toggle_mode)
@@ -273,13 +411,13 @@ class StudySessionView(ctk.CTkToplevel):
         self._bsh = ctk.CTkButton(
             uf, text="🔀", width=44, height=44,
             fg_color="#1e2030", hover_color="#2a2d40",
-            corner_radius=22, font=ctk.CTkFont(size=18),
+            corner_radius=22, font=get_font(18, family=None),
             command=self._shuffle)
         self._bsh.pack(side="right", padx=(8, 0))
         self._bun = ctk.CTkButton(
             uf, text="↩", width=44, height=44,
             fg_color="#1e2030", hover_color="#2a2d40",
-            corner_radius=22, font=ctk.CTkFont(size=18),
+            corner_radius=22, font=get_font(18, family=None),
             command=self._go_back, state="disabled")
         self._bun.pack(side="right")
 
@@ -289,14 +427,14 @@ class StudySessionView(ctk.CTkToplevel):
             cb, text="✗", width=64, height=64, corner_radius=32,
             fg_color=self.CWRONG, hover_color=self.CWRONGH,
             text_color="#f06070",
-            font=ctk.CTkFont(size=28, weight="bold"),
+            font=get_font(28, "bold", family=None),
             command=self.mark_unknown)
         self._bx.pack(side="left", padx=20)
         self._bo = ctk.CTkButton(
             cb, text="✓", width=64, height=64, corner_radius=32,
             fg_color=self.CRIGHT, hover_color=self.CRIGH_H,
             text_color=self.CKNOWN,
-            font=ctk.CTkFont(size=28, weight="bold"),
+            font=get_font(28, "bold", family=None),
             command=self.mark_known)
         self._bo.pack(side="left", padx=20)
 
@@ -304,14 +442,9 @@ class StudySessionView(ctk.CTkToplevel):
     #  FACE BUILDERS
     # ══════════════════════════════════════════════════════════════════
     def _build_faces(self):
-        if self._face_front:
-            self._face_front.destroy()
-        if self._face_back:
-            self._face_back.destroy()
-
-        card = self._cards[self._idx]
-        word = f"{card.article} {card.front}" if card.article else card.front
-        trans = card.back or "—"
+        """Create both face frames ONCE; per-card data goes in via
+        _refresh_faces, so navigation never destroys/rebuilds widgets."""
+        flip = lambda _: self._flip()
 
         # ── FRONT ─────────────────────────────────────────────────────
         ff = ctk.CTkFrame(self._card_host, fg_color=self.CARD,
@@ -319,35 +452,32 @@ class StudySessionView(ctk.CTkToplevel):
                           border_color=self.CARD_BD)
         ff.grid(row=0, column=0, sticky="nsew")
         ff.pack_propagate(False)
-        ff.bind("<Button-1>", lambda _: self._flip())
+        ff.bind("<Button-1>", flip)
 
-        if card.word_type:
-            b = ctk.CTkLabel(ff, text=f"  {card.word_type}  ",
-                             font=ctk.CTkFont(family=Theme.FONT_FAMILY,
-                                              size=11, weight="bold"),
-                             text_color="#fff", fg_color=self.CACC,
-                             corner_radius=10, width=70, height=22)
-            b.pack(pady=(28, 0))
-            b.bind("<Button-1>", lambda _: self._flip())
-
-        wl = ctk.CTkLabel(ff, text=word,
-                          font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=40,
-                                           weight="bold"),
-                          text_color=self.CTXT, wraplength=500)
-        wl.pack(expand=True)
-        wl.bind("<Button-1>", lambda _: self._flip())
+        self._w_badge = ctk.CTkLabel(ff, text="",
+                                     font=get_font(11, "bold"),
+                                     text_color="#fff", fg_color=self.CACC,
+                                     corner_radius=10, width=70, height=22)
+        self._w_badge.bind("<Button-1>", flip)
+        self._badge_packed = False
+
+        self._w_word = ctk.CTkLabel(ff, text="",
+                                    font=get_font(40, "bold"),
+                                    text_color=self.CTXT, wraplength=500)
+        self._w_word.pack(expand=True)
+        self._w_word.bind("<Button-1>", flip)
 
         ctk.CTkButton(ff, text="🔊  Escuchar", width=130, height=36,
                       fg_color="#1e2030", hover_color="#262a3a",
                       text_color=self.CMUT, corner_radius=8,
-                      font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=13),
+                      font=get_font(13),
                       command=self._tts).pack(pady=(0, 8))
 
         fh = ctk.CTkLabel(ff, text="Clic o [Espacio] para voltear",
-                          font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=12),
+                          font=get_font(12),
                           text_color="#3a3d50")
         fh.pack(pady=(0, 20))
-        fh.bind("<Button-1>", lambda _: self._flip())
+        fh.bind("<Button-1>", flip)
         self._face_front = ff
 
         # ── BACK ──────────────────────────────────────────────────────
@@ -356,37 +486,68 @@ class StudySessionView(ctk.CTkToplevel):
                           border_color=self.CARD_BD)
         bf.grid(row=0, column=0, sticky="nsew")
         bf.pack_propagate(False)
-        bf.bind("<Button-1>", lambda _: self._flip())
+        bf.bind("<Button-1>", flip)
+
+        self._w_back_word = ctk.CTkLabel(bf, text="",
+                                         font=get_font(16),
+                                         text_color=self.CMUT)
+        self._w_back_word.pack(pady=(24, 4))
+        self._w_back_word.bind("<Button-1>", flip)
+
+        self._w_trans = ctk.CTkLabel(bf, text="",
+                                     font=get_font(34, "bold"),
+                                     text_color=self.CKNOWN, wraplength=500)
+        self._w_trans.pack(expand=True)
+        self._w_trans.bind("<Button-1>", flip)
+
+        self._w_example = ctk.CTkLabel(bf, text="",
+                                       font=get_font(13),
+                                       text_color=self.CMUT, wraplength=480,
+                                       justify="center")
+        self._w_example.bind("<Button-1>", flip)
+        self._example_packed = False
+
+        self._w_back_hint = ctk.CTkLabel(bf, text="Clic para volver al anverso",
+                                         font=get_font(12),
+                                         text_color="#3a3d50")
+        self._w_back_hint.pack(pady=(0, 20))
+        self._w_back_hint.bind("<Button-1>", flip)
+        self._face_back = bf
+
+    def _refresh_faces(self):
+        """Point the persistent face widgets at the current card."""
+        if self._face_front is None:
+            self._build_faces()
 
-        sm = ctk.CTkLabel(bf, text=word,
-                          font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=16),
-                          text_color=self.CMUT)
-        sm.pack(pady=(24, 4))
-        sm.bind("<Button-1>", lambda _: self._flip())
+        card = self._cards[self._idx]
+        word = _display_word(card)
+        trans = card.back or "—"
+
+        self._w_word.configure(text=word)
+        self._w_back_word.configure(text=word)
+        self._w_trans.configure(text=trans)
 
-        tr = ctk.CTkLabel(bf, text=trans,
-                          font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=34,
-                                           weight="bold"),
-                          text_color=self.CKNOWN, wraplength=500)
-        tr.pack(expand=True)
-        tr.bind("<Button-1>", lambda _: self._flip())
+        if card.word_type:
+            self._w_badge.configure(text=f"  {card.word_type}  ")
+            if not self._badge_packed:
+                self._w_badge.pack(pady=(28, 0), before=self._w_word)
+                self._badge_packed = True
+        elif self._badge_packed:
+            self._w_badge.pack_forget()
+            self._badge_packed = False
 
         ex = card.example_sentence or ""
         if ex:
-            el = ctk.CTkLabel(bf, text=f"« {ex} »",
-                              font=ctk.CTkFont(family=Theme.FONT_FAMILY,
-                                               size=13),
-                              text_color=self.CMUT, wraplength=480,
-                              justify="center")
-            el.pack(pady=(0, 8))
-            el.bind("<Button-1>", lambda _: self._flip())
-
-        bh = ctk.CTkLabel(bf, text="Clic para volver al anverso",
-                          font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=12),
-                          text_color="#3a3d50")
-        bh.pack(pady=(0, 20))
-        bh.bind("<Button-1>", lambda _: self._flip())
-        self._face_back = bf
+            quoted = getattr(card, "_display_example", None)
+            if quoted is None:
+                quoted = card._display_example = f"« {ex} »"
+            self._w_example.configure(text=quoted)
+            if not self._example_packed:
+                self._w_example.pack(pady=(0, 8), before=self._w_back_hint)
+                self._example_packed = True
+        elif self._example_packed:
+            self._w_example.pack_forget()
+            self._example_packed = False
 
     # ══════════════════════════════════════════════════════════════════
     #  CARD DISPLAY
@@ -397,11 +558,16 @@ class StudySessionView(ctk.CTkToplevel):
 
         self._showing_back = False
         self._done = False
-        self._build_faces()
+        self._refresh_faces()
         self._face_front.tkraise()
         self._lc.configure(
             text=f"Tarjeta {self._idx + 1} de {len(self._cards)}")
 
+        # Warm the audio cache for this card while the user reads it, so
+        # a speaker click plays locally instead of waiting on the gTTS
+        # round trip.  Shares the TTS worker — never blocks the UI.
+        _TTS_EXEC.submit(_ensure_audio, _display_word(self._cards[self._idx]))
+
     # ══════════════════════════════════════════════════════════════════
     #  FLIP ANIMATION  (cross-fade via window alpha)
     # ══════════════════════════════════════════════════════════════════
@@ -409,19 +575,38 @@ class StudySessionView(ctk.CTkToplevel):
         if self._anim or self._done:
             return
         self._anim = True
-        self._fade_dim(0)
-
-    def _fade_dim(self, step: int):
-        if step > _FADE_STEPS:
-            self._do_swap()
-            self._fade_bright(0)
+        self._animate(_FADE_SCHED_DIM, 0, self._after_dim)
+
+    def _set_alpha(self, alpha: float, *, force: bool = False):
+        # Sub-1% alpha deltas are invisible — skip the Tk IPC round trip.
+        # Terminal values pass force=True: 1.0 in particular must always
+        # land, or the window stays fractionally translucent (and on the
+        # compositor's expensive translucency path) forever.
+        if not force and abs(alpha - self._last_alpha) < 0.01:
             return
-        t = step / _FADE_STEPS
-        e = math.sin(t * math.pi / 2)
-        alpha = 1.0 - (1.0 - _ALPHA_MIN) * e
         try: self.attributes("-alpha", alpha)
         except tk.TclError: pass
-        self.after(_FADE_MS, self._fade_dim, step + 1)
+        self._last_alpha = alpha
+
+    def _animate(self, sched, i: int, done):
+        """Step through an alpha schedule, then hand off to *done*.
+
+        One bound method drives both fade phases — the per-tick work is
+        an index bump, a table lookup, and the reschedule.
+        """
+        if i >= len(sched):
+            done()
+            return
+        self._set_alpha(sched[i])
+        self.after(_FADE_MS, self._animate, sched, i + 1, done)
+
+    def _after_dim(self):
+        self._do_swap()
+        self._animate(_FADE_SCHED_BRIGHT, 0, self._after_bright)
+
+    def _after_bright(self):
+        self._set_alpha(1.0, force=True)
+        self._anim = False
 
     def _do_swap(self):
         if self._showing_back:
@@ -431,19 +616,6 @@ class StudySessionView(ctk.CTkToplevel):
             self._showing_back = True
             self._face_back.tkraise()
 
-    def _fade_bright(self, step: int):
-        if step > _FADE_STEPS:
-            try: self.attributes("-alpha", 1.0)
-            except tk.TclError: pass
-            self._anim = False
-            return
-        t = step / _FADE_STEPS
-        e = math.sin(t * math.pi / 2)
-        alpha = _ALPHA_MIN + (1.0 - _ALPHA_MIN) * e
-        try: self.attributes("-alpha", alpha)
-        except tk.TclError: pass
-        self.after(_FADE_MS, self._fade_bright, step + 1)
-
     # ══════════════════════════════════════════════════════════════════
     #  ACTIONS
     # ══════════════════════════════════════════════════════════════════
@@ -460,32 +632,44 @@ class StudySessionView(ctk.CTkToplevel):
     def _answer(self, quality: int):
         """Record answer to visual history; persist to DB only if tracking."""
         card = self._cards[self._idx]
-        entry = _HistoryEntry(
-            card_id=card.id,
-            card_idx=self._idx,
-            was_tracked=self._track,
-            quality=quality,
-            prev_reps=card.repetitions,
-            prev_ease=card.easiness,
-            prev_interval=card.interval,
-            prev_next=card.next_review,
-        )
+        if self._track:
+            entry = _HistoryEntry(
+                card_id=card.id,
+                card_idx=self._idx,
+                quality=quality,
+                prev_reps=card.repetitions,
+                prev_ease=card.easiness,
+                prev_interval=card.interval,
+                prev_next=card.next_review,
+            )
+        else:
+            # Cram mode only ever navigates back — the index is enough.
+            entry = self._idx
 
         if self._track:
-            # Persist to DB
-            s = get_session()
-            try:
-                m = s.merge(card)
-                record_review(s, m, quality)
-                last = (s.query(ReviewLog).filter(ReviewLog.card_id == card.id)
-                         .order_by(ReviewLog.id.desc()).first())
-                entry.log_id = last.id if last else None
-                card.repetitions = m.repetitions
-                card.easiness    = m.easiness
-                card.interval    = m.interval
-                card.next_review = m.next_review
-            finally:
-                s.close()
+            # Grade in memory; the DB write is deferred to _flush_reviews
+            new_reps, new_ef, new_interval = calculate_sm2(
+                quality, card.repetitions, card.easiness, card.interval)
+            now = datetime.now(timezone.utc)
+            card.repetitions = new_reps
+            card.easiness    = new_ef
+            card.interval    = new_interval
+            card.next_review = now + timedelta(days=new_interval)
+
+            self._pending_cards[card.id] = {
+                "id": card.id,
+                "repetitions": new_reps,
+                "easiness": new_ef,
+                "interval": new_interval,
+                "next_review": card.next_review,
+            }
+            self._pending_logs.append({
+                "card_id": card.id,
+                "quality": quality,
+                "easiness_after": new_ef,
+                "interval_after": new_interval,
+                "reviewed_at": now,
+            })
 
             if quality >= 3:
                 self._known += 1
@@ -506,44 +690,55 @@ class StudySessionView(ctk.CTkToplevel):
 
         entry = self._history.pop()
 
-        # If this card was answered in tracked mode → rollback DB
-        if entry.was_tracked and entry.log_id is not None:
-            s = get_session()
-            try:
-                cd = s.get(Card, entry.card_id)
-                if cd:
-                    cd.repetitions = entry.prev_reps
-                    cd.easiness    = entry.prev_ease
-                    cd.interval    = entry.prev_interval
-                    cd.next_review = entry.prev_next
-                rl = s.get(ReviewLog, entry.log_id)
-                if rl:
-                    s.delete(rl)
-                s.commit()
-            finally:
-                s.close()
-
-            # Revert local card object too
-            for c in self._cards:
-                if c.id == entry.card_id:
-                    c.repetitions = entry.prev_reps
-                    c.easiness    = entry.prev_ease
-                    c.interval    = entry.prev_interval
-                    c.next_review = entry.prev_next
-                    break
-
-            # Revert counters
-            if entry.quality >= 3:
-                self._known  = max(0, self._known - 1)
-                self._s_known = max(0, self._s_known - 1)
-                self._prog += 1
-            self._upd()
+        # Bare index = untracked answer; nothing to revert but position.
+        if not isinstance(entry, _HistoryEntry):
+            self._idx = entry
+            self._done = False
+            if self._summ_frame is not None:
+                self._summ_frame.grid_remove()
+            self._load_card()
+            if not self._history:
+                self._bun.configure(state="disabled")
+            return
+
+        # Tracked answer → drop the pending write and restore SM-2 state
+        for i in range(len(self._pending_logs) - 1, -1, -1):
+            if self._pending_logs[i]["card_id"] == entry.card_id:
+                del self._pending_logs[i]
+                break
+        if any(l["card_id"] == entry.card_id for l in self._pending_logs):
+            # An earlier answer for this card is still queued — the
+            # snapshot is exactly the state it left behind.
+            self._pending_cards[entry.card_id] = {
+                "id": entry.card_id,
+                "repetitions": entry.prev_reps,
+                "easiness": entry.prev_ease,
+                "interval": entry.prev_interval,
+                "next_review": entry.prev_next,
+            }
+        else:
+            self._pending_cards.pop(entry.card_id, None)
+
+        # Revert local card object too
+        c = self._cards_by_id.get(entry.card_id)
+        if c is not None:
+            c.repetitions = entry.prev_reps
+            c.easiness    = entry.prev_ease
+            c.interval    = entry.prev_interval
+            c.next_review = entry.prev_next
+
+        # Revert counters
+        if entry.quality >= 3:
+            self._known  = max(0, self._known - 1)
+            self._s_known = max(0, self._s_known - 1)
+            self._prog += 1
+        self._upd()
 
         # Navigate back visually
         self._idx = entry.card_idx
         self._done = False
-        if hasattr(self, "_summ_frame"):
-            self._summ_frame.destroy()
+        if self._summ_frame is not None:
+            self._summ_frame.grid_remove()
         self._load_card()
 
         if not self._history:
@@ -555,8 +750,11 @@ class StudySessionView(ctk.CTkToplevel):
             return
         self._shuffled = not self._shuffled
         if self._shuffled:
-            random.shuffle(self._cards)
-            self._idx = 0
+            # Shuffle only the upcoming cards: already-seen positions keep
+            # their order, so _HistoryEntry.card_idx stays valid for undo.
+            tail = self._cards[self._idx:]
+            self._rng.shuffle(tail)
+            self._cards[self._idx:] = tail
             self._bsh.configure(fg_color=self.CACC, hover_color="#6958d9")
             self._load_card()
         else:
@@ -567,6 +765,10 @@ class StudySessionView(ctk.CTkToplevel):
         """Switch ON = SM-2 due cards, OFF = ALL cards (cram)."""
         self._track = bool(self._sw.get())
 
+        # The reload filters the in-memory snapshot (no SQL), but flush
+        # anyway so a crash mid-session can't lose answered cards.
+        self._flush_reviews()
+
         if self._track:
             # Show counters, hide sandbox label
             self._sandbox_lbl.grid_remove()
@@ -601,66 +803,112 @@ class StudySessionView(ctk.CTkToplevel):
 
     # ── helpers ───────────────────────────────────────────────────────
     def _upd(self):
+        # Coalesce counter updates: keyboard auto-repeat on ←/→ can mark
+        # several cards per frame, but one idle-time configure pair is
+        # enough — the labels read current state when it fires.
+        if self._upd_pending:
+            return
+        self._upd_pending = True
+        self.after_idle(self._apply_upd)
+
+    def _apply_upd(self):
+        self._upd_pending = False
         self._lp.configure(text=str(self._prog))
         self._lk.configure(text=str(self._known))
 
     def _tts(self):
+        global _tts_future
         if self._idx >= len(self._cards): return
-        c = self._cards[self._idx]
-        w = f"{c.article} {c.front}" if c.article else c.front
-        threading.Thread(target=_play_audio, args=(w,), daemon=True).start()
+        if _tts_future is not None and not _tts_future.done():
+            return  # still synthesizing the previous click
+        w = _display_word(self._cards[self._idx])
+        _tts_future = _TTS_EXEC.submit(_play_audio, w)
 
     # ══════════════════════════════════════════════════════════════════
     #  SESSION END
     # ══════════════════════════════════════════════════════════════════
     def _finish(self):
         self._done = True
-        if self._face_front:
-            self._face_front.destroy(); self._face_front = None
-        if self._face_back:
-            self._face_back.destroy(); self._face_back = None
+        if self._summ_frame is None:
+            self._build_summary()
 
+        tot = len(self._cards)
+        pct = round(self._s_known / tot * 100) if tot else 0
+        for lbl, v in zip(self._summ_values, (
+            str(self._s_known),
+            str(tot - self._s_known),
+            f"{pct}%",
+            str(self._known),
+        )):
+            lbl.configure(text=v)
+
+        self._summ_frame.grid()
+        self._summ_frame.tkraise()
+
+    def _build_summary(self):
+        """Create the summary skeleton once; _finish only updates values."""
         self._summ_frame = ctk.CTkFrame(self._card_host, fg_color="transparent")
         self._summ_frame.grid(row=0, column=0, sticky="nsew")
         inn = ctk.CTkFrame(self._summ_frame, fg_color="transparent")
         inn.pack(expand=True)
 
-        tot = len(self._cards)
-        pct = round(self._s_known / tot * 100) if tot else 0
-
         ctk.CTkLabel(inn, text="🎉",
-                     font=ctk.CTkFont(size=48)).pack(pady=(0, 8))
+                     font=get_font(48, family=None)).pack(pady=(0, 8))
         ctk.CTkLabel(inn, text="¡Sesión completada!",
-                     font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=26,
-                                      weight="bold"),
+                     font=get_font(26, "bold"),
                      text_color=self.CKNOWN).pack(pady=(0, 20))
 
         st = ctk.CTkFrame(inn, fg_color=self.CARD, corner_radius=16)
         st.pack(padx=40, pady=(0, 24))
-        for lb, v, cl in [
-            ("Conocidas",       str(self._s_known),        self.CKNOWN),
-            ("En progreso",     str(tot - self._s_known),  self.CPROG),
-            ("Precisión",       f"{pct}%",                 self.CACC),
-            ("Total histórico", str(self._known),          self.CTXT),
+        self._summ_values: list[ctk.CTkLabel] = []
+        for lb, cl in [
+            ("Conocidas",       self.CKNOWN),
+            ("En progreso",     self.CPROG),
+            ("Precisión",       self.CACC),
+            ("Total histórico", self.CTXT),
         ]:
             col = ctk.CTkFrame(st, fg_color="transparent")
             col.pack(side="left", padx=24, pady=20)
             ctk.CTkLabel(col, text=lb.upper(),
-                         font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=11,
-                                          weight="bold"),
+                         font=get_font(11, "bold"),
                          text_color=self.CMUT).pack()
-            ctk.CTkLabel(col, text=v,
-                         font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=32,
-                                          weight="bold"),
-                         text_color=cl).pack(pady=(4, 0))
+            val = ctk.CTkLabel(col, text="",
+                               font=get_font(32, "bold"),
+                               text_color=cl)
+            val.pack(pady=(4, 0))
+            self._summ_values.append(val)
 
         ctk.CTkButton(inn, text="Cerrar sesión", command=self._close,
                       fg_color=self.CACC, hover_color="#6958d9",
                       width=160, height=44, corner_radius=10,
-                      font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=15,
-                                       weight="bold")).pack()
+                      font=get_font(15, "bold")).pack()
+
+    def _flush_reviews(self):
+        """Write every pending review in one transaction."""
+        if not self._pending_logs and not self._pending_cards:
+            return
+        s = get_session()
+        try:
+            if self._pending_cards:
+                # Bulk UPDATE by primary key (executemany)
+                s.execute(update(Card), list(self._pending_cards.values()))
+            if self._pending_logs:
+                s.bulk_insert_mappings(ReviewLog, self._pending_logs)
+            s.commit()
+            log.info("Flushed %d reviews (%d card updates)",
+                     len(self._pending_logs), len(self._pending_cards))
+        except Exception:
+            s.rollback()
+            raise
+        finally:
+            s.close()
+        self._pending_cards.clear()
+        self._pending_logs.clear()
+        invalidate_deck_stats(self._deck_id)
+        invalidate_known(self._deck_id)
 
     def _close(self):
+        self._flush_reviews()
         if self._on_close:
             self._on_close()
         self.destroy()
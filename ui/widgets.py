@@ -31,6 +31,26 @@ class Theme:
     FONT_MONO      = "Consolas"
 
 
+# ---------------------------------------------------------------------------
+# Shared fonts
+# ---------------------------------------------------------------------------
+# Every CTkFont registers a named font with Tk over IPC, so constructing
+# one per label adds up on rebuild-heavy views.  Fonts are never mutated
+# here, so identical (family, size, weight) combinations can share one
+# instance for the life of the app.
+_FONT_CACHE: dict[tuple, ctk.CTkFont] = {}
+
+
+def get_font(size: int, weight: str = "normal",
+             family: str | None = Theme.FONT_FAMILY) -> ctk.CTkFont:
+    """Return a cached CTkFont; ``family=None`` uses the CTk theme font."""
+    key = (family, size, weight)
+    font = _FONT_CACHE.get(key)
+    if font is None:
+        font = _FONT_CACHE[key] = ctk.CTkFont(family=family, size=size, weight=weight)
+    return font
+
+
 # ---------------------------------------------------------------------------
 # Styled button
 # ---------------------------------------------------------------------------
@@ -42,7 +62,7 @@ class AccentButton(ctk.CTkButton):
         kw.setdefault("hover_color", Theme.ACCENT_HOVER)
         kw.setdefault("text_color", "#ffffff")
         kw.setdefault("corner_radius", 8)
-        kw.setdefault("font", ctk.CTkFont(family=Theme.FONT_FAMILY, size=14, weight="bold"))
+        kw.setdefault("font", get_font(14, "bold"))
         kw.setdefault("height", 36)
         super().__init__(master, text=text, command=command, **kw)
 
@@ -55,7 +75,7 @@ class DangerButton(ctk.CTkButton):
         kw.setdefault("hover_color", "#d44454")
         kw.setdefault("text_color", "#ffffff")
         kw.setdefault("corner_radius", 8)
-        kw.setdefault("font", ctk.CTkFont(family=Theme.FONT_FAMILY, size=13))
+        kw.setdefault("font", get_font(13))
         kw.setdefault("height", 32)
         super().__init__(master, text=text, command=command, **kw)
 
@@ -69,7 +89,7 @@ class GhostButton(ctk.CTkButton):
         kw.setdefault("text_color", Theme.TEXT_PRIMARY)
         kw.setdefault("anchor", "w")
         kw.setdefault("corner_radius", 6)
-        kw.setdefault("font", ctk.CTkFont(family=Theme.FONT_FAMILY, size=13))
+        kw.setdefault("font", get_font(13))
         kw.setdefault("height", 32)
         super().__init__(master, text=text, command=command, **kw)
 
@@ -87,14 +107,14 @@ class StatCard(ctk.CTkFrame):
 
         self._label = ctk.CTkLabel(
             self, text=label.upper(),
-            font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=11, weight="bold"),
+            font=get_font(11, "bold"),
             text_color=Theme.TEXT_MUTED,
         )
         self._label.pack(padx=16, pady=(14, 0), anchor="w")
 
         self._value = ctk.CTkLabel(
             self, text=value,
-            font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=28, weight="bold"),
+            font=get_font(28, "bold"),
             text_color=color,
         )
         self._value.pack(padx=16, pady=(2, 14), anchor="w")